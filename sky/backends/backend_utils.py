@@ -102,6 +102,17 @@ DEFAULT_TASK_CPU_DEMAND = 0.5
 CLUSTER_STATUS_LOCK_PATH = os.path.expanduser('~/.sky/.{}.lock')
 CLUSTER_STATUS_LOCK_TIMEOUT_SECONDS = 20
 
+# Clusters launched within this window (or still in INIT) are likely to be
+# changing state, so get_clusters(refresh_max_age_seconds=...) and
+# get_cached_cluster_status() trust their status for at most
+# _TRANSITIONING_STATUS_MAX_AGE_SECONDS.
+_RECENTLY_LAUNCHED_SECONDS = 5 * 60
+_TRANSITIONING_STATUS_MAX_AGE_SECONDS = 5
+# is_controller_up() trusts an UP controller status refreshed within this many
+# seconds, e.g., when `sky spot cancel` checks the controller before and again
+# inside core.spot_cancel().
+_CONTROLLER_UP_STATUS_MAX_AGE_SECONDS = 5
+
 # Filelocks for updating cluster's file_mounts.
 CLUSTER_FILE_MOUNTS_LOCK_PATH = os.path.expanduser(
     '~/.sky/.{}_file_mounts.lock')
@@ -1910,7 +1921,14 @@ def check_can_clone_disk_and_override_task(
         exceptions.NotSupportedError: If the source cluster is not valid or the
             task is not compatible to clone disk from the source cluster.
     """
-    source_cluster_status, handle = refresh_cluster_status_handle(cluster_name)
+    if target_cluster_name is None:
+        status_handles = [refresh_cluster_status_handle(cluster_name)]
+    else:
+        # Refreshing a cluster may query the cloud, so refresh the source and
+        # target clusters concurrently.
+        status_handles = subprocess_utils.run_in_parallel(
+            refresh_cluster_status_handle, [cluster_name, target_cluster_name])
+    source_cluster_status, handle = status_handles[0]
     if source_cluster_status is None:
         with ux_utils.print_exception_no_traceback():
             raise ValueError(
@@ -1929,8 +1947,7 @@ def check_can_clone_disk_and_override_task(
                 f'cluster first: sky stop {cluster_name}')
 
     if target_cluster_name is not None:
-        target_cluster_status, _ = refresh_cluster_status_handle(
-            target_cluster_name)
+        target_cluster_status, _ = status_handles[1]
         if target_cluster_status is not None:
             with ux_utils.print_exception_no_traceback():
                 raise exceptions.NotSupportedError(
@@ -2367,6 +2384,39 @@ def refresh_cluster_status_handle(
     return record['status'], record['handle']
 
 
+def _is_cluster_status_fresh(record: Dict[str, Any],
+                             max_age_seconds: float) -> bool:
+    """Returns whether the record's status was updated recently enough.
+
+    Clusters in INIT or launched in the last few minutes are likely to be
+    changing state, so their status is trusted for at most a few seconds.
+    """
+    if record['status_updated_at'] is None:
+        return False
+    now = time.time()
+    launched_for = now - (record['launched_at'] or 0)
+    if (record['status'] == status_lib.ClusterStatus.INIT or
+            launched_for < _RECENTLY_LAUNCHED_SECONDS):
+        max_age_seconds = min(max_age_seconds,
+                              _TRANSITIONING_STATUS_MAX_AGE_SECONDS)
+    return now - record['status_updated_at'] < max_age_seconds
+
+
+def get_cached_cluster_status(
+        cluster_name: str,
+        max_age_seconds: float) -> Optional[status_lib.ClusterStatus]:
+    """Returns the cluster status in the local state DB, if fresh.
+
+    Returns None if the cluster does not exist or its status was not updated
+    within max_age_seconds, in which case the caller should refresh it with
+    refresh_cluster_status_handle().
+    """
+    record = global_user_state.get_cluster_from_name(cluster_name)
+    if record is None or not _is_cluster_status_fresh(record, max_age_seconds):
+        return None
+    return record['status']
+
+
 # =====================================
 
 
@@ -2548,15 +2598,25 @@ def is_controller_up(
             controller_type.value.default_hint_if_non_existent)
     cluster_name = controller_type.value.cluster_name
     controller_name = controller_type.value.name.replace(' controller', '')
+    record = global_user_state.get_cluster_from_name(cluster_name)
     try:
-        # Set force_refresh_statuses=None to make sure the refresh only happens
-        # when the controller is INIT/UP (triggered in these statuses as the
-        # autostop is always set for the controller). This optimization avoids
-        # unnecessary costly refresh when the controller is already stopped.
-        # This optimization is based on the assumption that the user will not
-        # start the controller manually from the cloud console.
-        controller_status, handle = refresh_cluster_status_handle(
-            cluster_name, force_refresh_statuses=None)
+        if (record is not None and
+                record['status'] == status_lib.ClusterStatus.UP and
+                _is_cluster_status_fresh(
+                    record, _CONTROLLER_UP_STATUS_MAX_AGE_SECONDS)):
+            # The controller was just found UP (e.g., by an earlier check in
+            # the same command); skip querying the cloud again.
+            controller_status, handle = record['status'], record['handle']
+        else:
+            # Set force_refresh_statuses=None to make sure the refresh only
+            # happens when the controller is INIT/UP (triggered in these
+            # statuses as the autostop is always set for the controller).
+            # This optimization avoids unnecessary costly refresh when the
+            # controller is already stopped. This optimization is based on the
+            # assumption that the user will not start the controller manually
+            # from the cloud console.
+            controller_status, handle = refresh_cluster_status_handle(
+                cluster_name, force_refresh_statuses=None)
     except exceptions.ClusterStatusFetchingError as e:
         # We do not catch the exceptions related to the cluster owner identity
         # mismatch, please refer to the comment in
@@ -2599,6 +2659,7 @@ def get_clusters(
     refresh: bool,
     cloud_filter: CloudFilter = CloudFilter.CLOUDS_AND_DOCKER,
     cluster_names: Optional[Union[str, List[str]]] = None,
+    refresh_max_age_seconds: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Returns a list of cached or optionally refreshed cluster records.
 
@@ -2617,6 +2678,10 @@ def get_clusters(
             public clouds only, and 'local' for only local clouds.
         cluster_names: If provided, only return records for the given cluster
             names.
+        refresh_max_age_seconds: If provided with refresh=True, skip querying
+            the cloud for clusters whose status was updated within this many
+            seconds. Clusters in INIT or launched in the last few minutes
+            reuse their status for at most a few seconds.
 
     Returns:
         A list of cluster records. If the cluster does not exist or has been
@@ -2678,7 +2743,18 @@ def get_clusters(
         f'[bold cyan]Refreshing status for {len(records)} cluster{plural}[/]',
         total=len(records))
 
+    fresh_records = {}
+    if refresh_max_age_seconds is not None:
+        fresh_records = {
+            record['name']: record
+            for record in records
+            if _is_cluster_status_fresh(record, refresh_max_age_seconds)
+        }
+
     def _refresh_cluster(cluster_name):
+        if cluster_name in fresh_records:
+            progress.update(task, advance=1)
+            return fresh_records[cluster_name]
         try:
             record = _refresh_cluster_record(
                 cluster_name,
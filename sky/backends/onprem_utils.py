@@ -33,19 +33,21 @@ SKY_USER_LOCAL_CONFIG_PATH = '~/.sky/local/{}.yml'
 _SKY_GET_ACCELERATORS_SCRIPT_PATH = '~/.sky/get_accelerators.py'
 
 
-def check_if_local_cloud(cluster: str) -> bool:
+def check_if_local_cloud(cluster: str, check_configs: bool = True) -> bool:
     """Checks if cluster name is a local cloud.
 
     If cluster is a public cloud, this function will not check local
     cluster configs. If this cluster is a private cloud, this function
-    will run correctness tests for cluster configs.
+    will run correctness tests for cluster configs, unless check_configs is
+    False (e.g., the caller has already checked them).
     """
     config_path = os.path.expanduser(SKY_USER_LOCAL_CONFIG_PATH.format(cluster))
     if not os.path.exists(config_path):
         # Public clouds go through no error checking.
         return False
-    # Go through local cluster check to raise potential errors.
-    check_and_get_local_clusters(suppress_error=False)
+    if check_configs:
+        # Go through local cluster check to raise potential errors.
+        check_and_get_local_clusters(suppress_error=False)
     return True
 
 
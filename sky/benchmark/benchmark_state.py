@@ -235,22 +235,36 @@ def get_benchmark_clusters(benchmark_name: str) -> List[str]:
     return [row[0] for row in rows]
 
 
+def _get_benchmark_result_record(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    (cluster, status, num_nodes, resources, benchmark_record, benchmark) = row
+    if benchmark_record is not None:
+        benchmark_record = pickle.loads(benchmark_record)
+    return {
+        'cluster': cluster,
+        'status': BenchmarkStatus[status],
+        'num_nodes': num_nodes,
+        'resources': pickle.loads(resources),
+        'record': benchmark_record,
+        'benchmark': benchmark,
+    }
+
+
 def get_benchmark_results(benchmark_name: str) -> List[Dict[str, Any]]:
     rows = _BENCHMARK_DB.cursor.execute(
         'SELECT * FROM benchmark_results WHERE benchmark=(?)',
         (benchmark_name,))
-    records = []
-    for (cluster, status, num_nodes, resources, benchmark_record,
-         benchmark) in rows:
-        if benchmark_record is not None:
-            benchmark_record = pickle.loads(benchmark_record)
-        record = {
-            'cluster': cluster,
-            'status': BenchmarkStatus[status],
-            'num_nodes': num_nodes,
-            'resources': pickle.loads(resources),
-            'record': benchmark_record,
-            'benchmark': benchmark,
-        }
-        records.append(record)
+    return [_get_benchmark_result_record(row) for row in rows]
+
+
+def get_all_benchmark_results() -> Dict[str, List[Dict[str, Any]]]:
+    """Get the results of all benchmarks, keyed by benchmark name.
+
+    Equivalent to calling get_benchmark_results() on each benchmark, but
+    with a single query to the database.
+    """
+    rows = _BENCHMARK_DB.cursor.execute('SELECT * FROM benchmark_results')
+    records: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        record = _get_benchmark_result_record(row)
+        records.setdefault(record['benchmark'], []).append(record)
     return records
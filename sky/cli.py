@@ -23,25 +23,28 @@ NOTE: the order of command definitions in this file corresponds to how they are
 listed in "sky --help".  Take care to put logically connected commands close to
 each other.
 """
+import contextlib
 import copy
 import datetime
 import functools
 import multiprocessing
 import os
 import shlex
+import shutil
 import signal
+import socket
+import stat
 import subprocess
 import sys
 import textwrap
 import time
 import typing
-from typing import Any, Dict, List, Optional, Tuple, Union
-import webbrowser
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import click
 import colorama
-import dotenv
 from rich import progress as rich_progress
+from rich import text as rich_text
 import yaml
 
 import sky
@@ -57,8 +60,6 @@ from sky import spot as spot_lib
 from sky import status_lib
 from sky.backends import backend_utils
 from sky.backends import onprem_utils
-from sky.benchmark import benchmark_state
-from sky.benchmark import benchmark_utils
 from sky.clouds import service_catalog
 from sky.data import storage_utils
 from sky.skylet import constants
@@ -78,6 +79,11 @@ from sky.utils import timeline
 from sky.utils import ux_utils
 from sky.utils.cli_utils import status_utils
 
+# NOTE: `sky.benchmark.benchmark_state` and `sky.benchmark.benchmark_utils`
+# are imported inside the `sky bench` commands, as importing the former opens
+# (and creates the tables of) the benchmark database, which is unnecessary for
+# every other command.
+
 if typing.TYPE_CHECKING:
     from sky.backends import backend as backend_lib
 
@@ -89,26 +95,29 @@ _CLUSTER_FLAG_HELP = """\
 A cluster name. If provided, either reuse an existing cluster with that name or
 provision a new cluster with that name. Otherwise provision a new cluster with
 an autogenerated name."""
-_INTERACTIVE_NODE_TYPES = ('cpunode', 'gpunode', 'tpunode')
-_INTERACTIVE_NODE_DEFAULT_RESOURCES = {
-    'cpunode': sky.Resources(cloud=None,
-                             instance_type=None,
-                             accelerators=None,
-                             use_spot=False),
-    'gpunode': sky.Resources(cloud=None,
-                             instance_type=None,
-                             accelerators={'K80': 1},
-                             use_spot=False),
-    'tpunode': sky.Resources(cloud=sky.GCP(),
-                             instance_type=None,
-                             accelerators={'tpu-v2-8': 1},
-                             accelerator_args={'runtime_version': '2.12.0'},
-                             use_spot=False),
-}
-
+_INTERACTIVE_NODE_TYPES = frozenset({'cpunode', 'gpunode', 'tpunode'})
+# click param types are stateless, so these are shared by all the options
+# using them.
+_DISK_TIER_CHOICE = click.Choice(['low', 'medium', 'high'],
+                                 case_sensitive=False)
+_SHELL_CHOICE = click.Choice(['bash', 'zsh', 'fish', 'auto'])
 # The maximum number of in-progress spot jobs to show in the status
 # command.
 _NUM_SPOT_JOBS_TO_SHOW_IN_STATUS = 5
+# `sky status` reuses the in-progress spot jobs fetched by another `sky status`
+# within this many seconds (e.g., when it is polled in a loop), instead of
+# querying the spot controller again.
+_SPOT_JOBS_CACHE_TTL_SECONDS = 10
+# `sky status --refresh` and `sky start` do not query the cloud again for
+# clusters refreshed within this many seconds (e.g., dashboards polling
+# `sky status -r`). Set the env var to 0 to always query the cloud.
+_STATUS_REFRESH_TTL_ENV_VAR = 'SKYPILOT_STATUS_TTL'
+_DEFAULT_STATUS_REFRESH_TTL_SECONDS = 30
+# Maximum number of clusters `sky down/stop/autostop` operates on concurrently,
+# to avoid hitting the cloud APIs' rate limits when many clusters are torn down
+# at once (e.g., `sky down -a`).
+_DOWN_MAX_PARALLELISM_ENV_VAR = 'SKYPILOT_DOWN_MAX_PARALLELISM'
+_DEFAULT_DOWN_MAX_PARALLELISM = 16
 
 _STATUS_IP_CLUSTER_NUM_ERROR_MESSAGE = (
     '{cluster_num} cluster{plural} {verb}. Please specify an existing '
@@ -118,32 +127,117 @@ _DAG_NOT_SUPPORTED_MESSAGE = ('YAML specifies a DAG which is only supported by '
                               '`sky spot launch`. `{command}` supports a '
                               'single task only.')
 
+# Cluster name -> (time.monotonic() of the refresh, (status, handle)), so that
+# back-to-back refreshes of the same cluster within one CLI invocation (e.g.,
+# `sky gpunode` refreshes before and again inside _launch_with_confirm) do not
+# each query the cloud.
+_CLUSTER_STATUS_CACHE: Dict[str, Tuple[
+    float, Tuple[Optional[status_lib.ClusterStatus],
+                 Optional[backends.ResourceHandle]]]] = {}
+_CLUSTER_STATUS_CACHE_TTL_SECONDS = 2.0
+
+# Directory of the scripts that `sky local up/down` run to manage the local
+# Kubernetes cluster.
+_LOCAL_CLUSTER_SCRIPTS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'utils', 'kubernetes')
+_LOCAL_UP_SCRIPT_PATH = os.path.join(_LOCAL_CLUSTER_SCRIPTS_DIR,
+                                     'create_cluster.sh')
+_LOCAL_DOWN_SCRIPT_PATH = os.path.join(_LOCAL_CLUSTER_SCRIPTS_DIR,
+                                       'delete_cluster.sh')
+
+
+def _raise_status_ip_cluster_num_error(num_clusters_found: int) -> None:
+    with ux_utils.print_exception_no_traceback():
+        raise ValueError(
+            _STATUS_IP_CLUSTER_NUM_ERROR_MESSAGE.format(
+                cluster_num=(str(num_clusters_found)
+                             if num_clusters_found > 0 else 'No'),
+                plural='s' if num_clusters_found > 1 else '',
+                verb='found'))
+
+
+def _get_status_refresh_ttl_seconds() -> float:
+    value = os.environ.get(_STATUS_REFRESH_TTL_ENV_VAR)
+    if value is None:
+        return _DEFAULT_STATUS_REFRESH_TTL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        raise click.BadParameter(
+            f'{_STATUS_REFRESH_TTL_ENV_VAR} must be a number of seconds, '
+            f'got {value!r}.') from None
+
+
+def _get_down_max_parallelism() -> int:
+    value = os.environ.get(_DOWN_MAX_PARALLELISM_ENV_VAR)
+    if value is None:
+        return _DEFAULT_DOWN_MAX_PARALLELISM
+    try:
+        parallelism = int(value)
+    except ValueError:
+        parallelism = 0
+    if parallelism < 1:
+        raise click.BadParameter(
+            f'{_DOWN_MAX_PARALLELISM_ENV_VAR} must be a positive integer, '
+            f'got {value!r}.')
+    return parallelism
+
+
+def _refresh_cluster_status_handle_cached(
+    cluster_name: str
+) -> Tuple[Optional[status_lib.ClusterStatus],
+           Optional[backends.ResourceHandle]]:
+    """Cached backend_utils.refresh_cluster_status_handle.
+
+    The result is reused for _CLUSTER_STATUS_CACHE_TTL_SECONDS.
+    """
+    cached = _CLUSTER_STATUS_CACHE.get(cluster_name)
+    if (cached is not None and
+            time.monotonic() - cached[0] <= _CLUSTER_STATUS_CACHE_TTL_SECONDS):
+        return cached[1]
+    result = backend_utils.refresh_cluster_status_handle(cluster_name)
+    _CLUSTER_STATUS_CACHE[cluster_name] = (time.monotonic(), result)
+    return result
+
+
+def _get_non_controller_cluster_names(cluster_names: List[str]) -> List[str]:
+    """Returns the cluster names that are not controllers, in order."""
+    return [
+        name for name in cluster_names
+        if controller_utils.Controllers.from_name(name) is None
+    ]
+
 
 def _get_glob_clusters(clusters: List[str], silent: bool = False) -> List[str]:
     """Returns a list of clusters that match the glob pattern."""
-    glob_clusters = []
-    for cluster in clusters:
-        glob_cluster = global_user_state.get_glob_cluster_names(cluster)
+    glob_clusters: Set[str] = set()
+    matches = global_user_state.get_glob_cluster_names_many(clusters)
+    # The local cluster configs only need to be validated once, however many
+    # of the patterns name uninitialized local clusters.
+    local_configs_checked = False
+    for cluster, glob_cluster in matches.items():
         if len(glob_cluster) == 0 and not silent:
-            if onprem_utils.check_if_local_cloud(cluster):
+            if onprem_utils.check_if_local_cloud(
+                    cluster, check_configs=not local_configs_checked):
+                local_configs_checked = True
                 click.echo(
                     constants.UNINITIALIZED_ONPREM_CLUSTER_MESSAGE.format(
                         cluster=cluster))
             else:
                 click.echo(f'Cluster {cluster} not found.')
-        glob_clusters.extend(glob_cluster)
-    return list(set(glob_clusters))
+        glob_clusters.update(glob_cluster)
+    return list(glob_clusters)
 
 
 def _get_glob_storages(storages: List[str]) -> List[str]:
     """Returns a list of storages that match the glob pattern."""
-    glob_storages = []
-    for storage_object in storages:
-        glob_storage = global_user_state.get_glob_storage_name(storage_object)
+    glob_storages: Set[str] = set()
+    matches = global_user_state.get_glob_storage_names_many(storages)
+    for storage_object, glob_storage in matches.items():
         if len(glob_storage) == 0:
             click.echo(f'Storage {storage_object} not found.')
-        glob_storages.extend(glob_storage)
-    return list(set(glob_storages))
+        glob_storages.update(glob_storage)
+    return list(glob_storages)
 
 
 def _warn_if_local_cluster(cluster: str, local_clusters: List[str],
@@ -155,10 +249,12 @@ def _warn_if_local_cluster(cluster: str, local_clusters: List[str],
     return True
 
 
-def _interactive_node_cli_command(cli_func):
-    """Click command decorator for interactive node commands."""
-    assert cli_func.__name__ in _INTERACTIVE_NODE_TYPES, cli_func.__name__
+def _make_interactive_node_options() -> Dict[str, List[Callable]]:
+    """Returns the click option decorators of each interactive node type.
 
+    The option decorators are created only once and shared across the node
+    types; click creates a fresh Option object each time one is applied.
+    """
     cluster_option = click.option('--cluster',
                                   '-c',
                                   default=None,
@@ -235,8 +331,7 @@ def _interactive_node_cli_command(cli_func):
                              help=('OS disk size in GBs.'))
     disk_tier = click.option('--disk-tier',
                              default=None,
-                             type=click.Choice(['low', 'medium', 'high'],
-                                               case_sensitive=False),
+                             type=_DISK_TIER_CHOICE,
                              required=False,
                              help=('OS disk tier. Could be one of "low", '
                                    '"medium", "high". Default: medium'))
@@ -301,36 +396,54 @@ def _interactive_node_cli_command(cli_func):
                                required=False,
                                help='The zone to use.')
 
+    def _options_for(node_type: str) -> List[Callable]:
+        return [
+            cluster_option,
+            no_confirm,
+            port_forward_option,
+            idle_autostop,
+            autodown,
+            retry_until_up,
+
+            # Resource options
+            *([cloud_option] if node_type != 'tpunode' else []),
+            region_option,
+            zone_option,
+            instance_type_option,
+            cpus,
+            memory,
+            *([gpus] if node_type == 'gpunode' else []),
+            *([tpus] if node_type == 'tpunode' else []),
+            spot_option,
+            *([tpuvm_option] if node_type == 'tpunode' else []),
+
+            # Attach options
+            screen_option,
+            tmux_option,
+            disk_size,
+            disk_tier,
+            ports,
+        ]
+
+    return {
+        node_type: _options_for(node_type)
+        for node_type in _INTERACTIVE_NODE_TYPES
+    }
+
+
+_INTERACTIVE_NODE_OPTIONS = _make_interactive_node_options()
+
+
+def _interactive_node_cli_command(cli_func):
+    """Click command decorator for interactive node commands."""
+    assert cli_func.__name__ in _INTERACTIVE_NODE_TYPES, cli_func.__name__
     click_decorators = [
         cli.command(cls=_DocumentedCodeCommand),
-        cluster_option,
-        no_confirm,
-        port_forward_option,
-        idle_autostop,
-        autodown,
-        retry_until_up,
-
-        # Resource options
-        *([cloud_option] if cli_func.__name__ != 'tpunode' else []),
-        region_option,
-        zone_option,
-        instance_type_option,
-        cpus,
-        memory,
-        *([gpus] if cli_func.__name__ == 'gpunode' else []),
-        *([tpus] if cli_func.__name__ == 'tpunode' else []),
-        spot_option,
-        *([tpuvm_option] if cli_func.__name__ == 'tpunode' else []),
-
-        # Attach options
-        screen_option,
-        tmux_option,
-        disk_size,
-        disk_tier,
-        ports,
+        *_INTERACTIVE_NODE_OPTIONS[cli_func.__name__],
     ]
-    decorator = functools.reduce(lambda res, f: f(res),
-                                 reversed(click_decorators), cli_func)
+    decorator = cli_func
+    for click_decorator in reversed(click_decorators):
+        decorator = click_decorator(decorator)
 
     return decorator
 
@@ -343,12 +456,8 @@ def _parse_env_var(env_var: str) -> Tuple[str, str]:
             raise click.UsageError(
                 f'{env_var} is not set in local environment.')
         return (env_var, value)
-    ret = tuple(env_var.split('=', 1))
-    if len(ret) != 2:
-        raise click.UsageError(
-            f'Invalid env var: {env_var}. Must be in the form of KEY=VAL '
-            'or KEY.')
-    return ret[0], ret[1]
+    key, _, value = env_var.partition('=')
+    return key, value
 
 
 def _merge_env_vars(env_dict: Optional[Dict[str, str]],
@@ -356,12 +465,23 @@ def _merge_env_vars(env_dict: Optional[Dict[str, str]],
     """Merges all values from env_list into env_dict."""
     if not env_dict:
         return env_list
-    for (key, value) in env_list:
-        env_dict[key] = value
+    env_dict.update(env_list)
     return list(env_dict.items())
 
 
-_TASK_OPTIONS = [
+class _DotenvFile(click.ParamType):
+    """Click type for a dotenv file, parsed into a dict of env vars.
+
+    dotenv is only imported when the option is actually passed.
+    """
+    name = 'dotenv'
+
+    def convert(self, value, param, ctx):
+        import dotenv  # pylint: disable=import-outside-toplevel
+        return dotenv.dotenv_values(value)
+
+
+_TASK_OPTIONS = (
     click.option('--name',
                  '-n',
                  required=False,
@@ -414,7 +534,7 @@ _TASK_OPTIONS = [
                        'Passing "none" resets the config.')),
     click.option('--env-file',
                  required=False,
-                 type=dotenv.dotenv_values,
+                 type=_DotenvFile(),
                  help="""\
         Path to a dotenv file with environment variables to set on the remote
         node.
@@ -440,9 +560,9 @@ _TASK_OPTIONS = [
 
         3. ``--env MY_ENV3``: set ``$MY_ENV3`` on the cluster to be the
         same value of ``$MY_ENV3`` in the local environment.""",
-    )
-]
-_EXTRA_RESOURCES_OPTIONS = [
+    ),
+)
+_EXTRA_RESOURCES_OPTIONS = (
     click.option(
         '--gpus',
         required=False,
@@ -475,7 +595,7 @@ _EXTRA_RESOURCES_OPTIONS = [
         help=('Ports to open on the cluster. '
               'If specified, overrides the "ports" config in the YAML. '),
     ),
-]
+)
 
 
 def _complete_cluster_name(ctx: click.Context, param: click.Parameter,
@@ -503,8 +623,9 @@ def _complete_file_name(ctx: click.Context, param: click.Parameter,
     return [click.shell_completion.CompletionItem(incomplete, type='file')]
 
 
+@functools.lru_cache(maxsize=1)
 def _get_click_major_version():
-    return int(click.__version__.split('.')[0])
+    return int(click.__version__.split('.', 1)[0])
 
 
 def _get_shell_complete_args(complete_fn):
@@ -519,6 +640,27 @@ _RELOAD_FISH_CMD = 'source ~/.config/fish/config.fish'
 _RELOAD_BASH_CMD = 'source ~/.bashrc'
 
 
+def _file_contains(path: str, marker: str) -> bool:
+    """Returns whether the (user-expanded) file at path contains marker."""
+    path = os.path.expanduser(path)
+    if not os.path.exists(path):
+        return False
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return marker in f.read()
+
+
+def _get_bash_major_version() -> int:
+    """Returns the major version of the user's bash, or 0 if unknown."""
+    try:
+        proc = subprocess.run(['bash', '-c', 'echo ${BASH_VERSINFO[0]}'],
+                              stdout=subprocess.PIPE,
+                              check=True,
+                              text=True)
+        return int(proc.stdout.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return 0
+
+
 def _install_shell_completion(ctx: click.Context, param: click.Parameter,
                               value: str):
     """A callback for installing shell completion for click."""
@@ -535,31 +677,21 @@ def _install_shell_completion(ctx: click.Context, param: click.Parameter,
         else:
             value = os.path.basename(os.environ['SHELL'])
 
-    zshrc_diff = '\n# For SkyPilot shell completion\n. ~/.sky/.sky-complete.zsh'
-    bashrc_diff = ('\n# For SkyPilot shell completion'
-                   '\n. ~/.sky/.sky-complete.bash')
-
+    # The rc file whose 'SkyPilot' marker means completion is already
+    # installed; None for shells that only need the completion file.
     if value == 'bash':
-        install_cmd = f'_SKY_COMPLETE=bash_source sky > \
-                ~/.sky/.sky-complete.bash && \
-                echo "{bashrc_diff}" >> ~/.bashrc'
-
-        cmd = (f'(grep -q "SkyPilot" ~/.bashrc) || '
-               f'[[ ${{BASH_VERSINFO[0]}} -ge 4 ]] && ({install_cmd})')
+        rc_path = '~/.bashrc'
+        completion_path = '~/.sky/.sky-complete.bash'
         reload_cmd = _RELOAD_BASH_CMD
 
     elif value == 'fish':
-        cmd = '_SKY_COMPLETE=fish_source sky > \
-                ~/.config/fish/completions/sky.fish'
-
+        rc_path = None
+        completion_path = '~/.config/fish/completions/sky.fish'
         reload_cmd = _RELOAD_FISH_CMD
 
     elif value == 'zsh':
-        install_cmd = f'_SKY_COMPLETE=zsh_source sky > \
-                ~/.sky/.sky-complete.zsh && \
-                echo "{zshrc_diff}" >> ~/.zshrc'
-
-        cmd = f'(grep -q "SkyPilot" ~/.zshrc) || ({install_cmd})'
+        rc_path = '~/.zshrc'
+        completion_path = '~/.sky/.sky-complete.zsh'
         reload_cmd = _RELOAD_ZSH_CMD
 
     else:
@@ -567,16 +699,57 @@ def _install_shell_completion(ctx: click.Context, param: click.Parameter,
         ctx.exit()
 
     try:
-        subprocess.run(cmd, shell=True, check=True, executable='/bin/bash')
+        if rc_path is None or not _file_contains(rc_path, 'SkyPilot'):
+            if value == 'bash' and _get_bash_major_version() < 4:
+                click.secho('Shell completion requires bash >= 4.', fg='red')
+                ctx.exit()
+            # Generate the completion script with argv and an explicit env,
+            # rather than through a /bin/bash pipeline.
+            expanded_completion_path = os.path.expanduser(completion_path)
+            os.makedirs(os.path.dirname(expanded_completion_path),
+                        exist_ok=True)
+            with open(expanded_completion_path, 'w') as f:
+                subprocess.run(['sky'],
+                               env=dict(os.environ,
+                                        _SKY_COMPLETE=f'{value}_source'),
+                               stdout=f,
+                               check=True)
+            if rc_path is not None:
+                with open(os.path.expanduser(rc_path), 'a') as f:
+                    f.write('\n# For SkyPilot shell completion'
+                            f'\n. {completion_path}\n')
         click.secho(f'Shell completion installed for {value}', fg='green')
         click.echo(
             'Completion will take effect once you restart the terminal: ' +
             click.style(f'{reload_cmd}', bold=True))
     except subprocess.CalledProcessError as e:
         click.secho(f'> Installation failed with code {e.returncode}', fg='red')
+    except OSError as e:
+        click.secho(f'> Installation failed: {e}', fg='red')
     ctx.exit()
 
 
+def _remove_lines_containing(path: str, markers: Tuple[str, ...]) -> None:
+    """Drops the lines of the (user-expanded) file containing any marker.
+
+    The file is rewritten atomically; symlinks (e.g., dotfile managers) are
+    resolved so the link itself is kept.
+    """
+    path = os.path.realpath(os.path.expanduser(path))
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    kept = [
+        line for line in lines if not any(marker in line for marker in markers)
+    ]
+    if len(kept) == len(lines):
+        return
+    tmp_path = f'{path}.sky.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(kept)
+    shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
+
+
 def _uninstall_shell_completion(ctx: click.Context, param: click.Parameter,
                                 value: str):
     """A callback for uninstalling shell completion for click."""
@@ -594,21 +767,18 @@ def _uninstall_shell_completion(ctx: click.Context, param: click.Parameter,
             value = os.path.basename(os.environ['SHELL'])
 
     if value == 'bash':
-        cmd = 'sed -i"" -e "/# For SkyPilot shell completion/d" ~/.bashrc && \
-               sed -i"" -e "/sky-complete.bash/d" ~/.bashrc && \
-               rm -f ~/.sky/.sky-complete.bash'
-
+        rc_path = '~/.bashrc'
+        completion_path = '~/.sky/.sky-complete.bash'
         reload_cmd = _RELOAD_BASH_CMD
 
     elif value == 'fish':
-        cmd = 'rm -f ~/.config/fish/completions/sky.fish'
+        rc_path = None
+        completion_path = '~/.config/fish/completions/sky.fish'
         reload_cmd = _RELOAD_FISH_CMD
 
     elif value == 'zsh':
-        cmd = 'sed -i"" -e "/# For SkyPilot shell completion/d" ~/.zshrc && \
-               sed -i"" -e "/sky-complete.zsh/d" ~/.zshrc && \
-               rm -f ~/.sky/.sky-complete.zsh'
-
+        rc_path = '~/.zshrc'
+        completion_path = '~/.sky/.sky-complete.zsh'
         reload_cmd = _RELOAD_ZSH_CMD
 
     else:
@@ -616,17 +786,23 @@ def _uninstall_shell_completion(ctx: click.Context, param: click.Parameter,
         ctx.exit()
 
     try:
-        subprocess.run(cmd, shell=True, check=True)
+        if rc_path is not None:
+            _remove_lines_containing(
+                rc_path,
+                ('# For SkyPilot shell completion', f'sky-complete.{value}'))
+        try:
+            os.remove(os.path.expanduser(completion_path))
+        except FileNotFoundError:
+            pass
         click.secho(f'Shell completion uninstalled for {value}', fg='green')
         click.echo('Changes will take effect once you restart the terminal: ' +
                    click.style(f'{reload_cmd}', bold=True))
-    except subprocess.CalledProcessError as e:
-        click.secho(f'> Uninstallation failed with code {e.returncode}',
-                    fg='red')
+    except OSError as e:
+        click.secho(f'> Uninstallation failed: {e}', fg='red')
     ctx.exit()
 
 
-def _add_click_options(options: List[click.Option]):
+def _add_click_options(options: Tuple[Callable, ...]):
     """A decorator for adding a list of click option decorators."""
 
     def _add_options(func):
@@ -651,58 +827,65 @@ def _parse_override_params(
         disk_tier: Optional[str] = None,
         ports: Optional[Tuple[str]] = None) -> Dict[str, Any]:
     """Parses the override parameters into a dictionary."""
+    # (override key, value, whether passing "none" resets the config).
+    params = (
+        ('cloud', cloud, True),
+        ('region', region, True),
+        ('zone', zone, True),
+        ('accelerators', gpus, True),
+        ('cpus', cpus, True),
+        ('memory', memory, True),
+        ('instance_type', instance_type, True),
+        ('use_spot', use_spot, False),
+        ('image_id', image_id, True),
+        ('disk_size', disk_size, False),
+        ('disk_tier', disk_tier, False),
+    )
     override_params: Dict[str, Any] = {}
-    if cloud is not None:
-        if cloud.lower() == 'none':
-            override_params['cloud'] = None
-        else:
-            override_params['cloud'] = clouds.CLOUD_REGISTRY.from_str(cloud)
-    if region is not None:
-        if region.lower() == 'none':
-            override_params['region'] = None
-        else:
-            override_params['region'] = region
-    if zone is not None:
-        if zone.lower() == 'none':
-            override_params['zone'] = None
-        else:
-            override_params['zone'] = zone
-    if gpus is not None:
-        if gpus.lower() == 'none':
-            override_params['accelerators'] = None
-        else:
-            override_params['accelerators'] = gpus
-    if cpus is not None:
-        if cpus.lower() == 'none':
-            override_params['cpus'] = None
-        else:
-            override_params['cpus'] = cpus
-    if memory is not None:
-        if memory.lower() == 'none':
-            override_params['memory'] = None
-        else:
-            override_params['memory'] = memory
-    if instance_type is not None:
-        if instance_type.lower() == 'none':
-            override_params['instance_type'] = None
-        else:
-            override_params['instance_type'] = instance_type
-    if use_spot is not None:
-        override_params['use_spot'] = use_spot
-    if image_id is not None:
-        if image_id.lower() == 'none':
-            override_params['image_id'] = None
-        else:
-            override_params['image_id'] = image_id
-    if disk_size is not None:
-        override_params['disk_size'] = disk_size
-    if disk_tier is not None:
-        override_params['disk_tier'] = disk_tier
+    for key, value, resettable in params:
+        if value is None:
+            continue
+        if resettable and value.lower() == 'none':
+            value = None
+        elif key == 'cloud':
+            value = clouds.CLOUD_REGISTRY.from_str(value)
+        override_params[key] = value
     if ports:
         override_params['ports'] = ports
     return override_params
 
 
+def _interactive_node_default_resources(node_type: str) -> 'sky.Resources':
+    """Returns the default resources of an interactive node.
+
+    Built on demand (and fresh on each call, as callers may mutate e.g. the
+    accelerator args) rather than at import time, so that commands other than
+    `sky cpunode/gpunode/tpunode` do not pay for constructing them.
+    """
+    assert node_type in _INTERACTIVE_NODE_TYPES, node_type
+    if node_type == 'cpunode':
+        return sky.Resources(cloud=None,
+                             instance_type=None,
+                             accelerators=None,
+                             use_spot=False)
+    if node_type == 'gpunode':
+        return sky.Resources(cloud=None,
+                             instance_type=None,
+                             accelerators={'K80': 1},
+                             use_spot=False)
+    return sky.Resources(cloud=sky.GCP(),
+                         instance_type=None,
+                         accelerators={'tpu-v2-8': 1},
+                         accelerator_args={'runtime_version': '2.12.0'},
+                         use_spot=False)
+
+
+def _is_any_resource_specified(*resource_args: Any) -> bool:
+    """Returns whether any of the interactive node's resource flags is set."""
+    return any(arg is not None for arg in resource_args)
+
+
+@functools.lru_cache(maxsize=None)
 def _default_interactive_node_name(node_type: str):
     """Returns a deterministic name to refer to the same node."""
     # FIXME: this technically can collide in Azure/GCP with another
@@ -719,9 +902,8 @@ def _infer_interactive_node_type(resources: sky.Resources):
     if accelerators:
         # We only support homogenous accelerators for now.
         assert len(accelerators) == 1, resources
-        acc, _ = list(accelerators.items())[0]
-        is_gcp = cloud is not None and cloud.is_same_cloud(sky.GCP())
-        if is_gcp and 'tpu' in acc:
+        acc = next(iter(accelerators))
+        if isinstance(cloud, clouds.GCP) and acc.lower().startswith('tpu-'):
             return 'tpunode'
         return 'gpunode'
     return 'cpunode'
@@ -730,6 +912,7 @@ def _infer_interactive_node_type(resources: sky.Resources):
 def _check_resources_match(backend: backends.Backend,
                            cluster_name: str,
                            task: 'sky.Task',
+                           handle: Optional[backends.ResourceHandle],
                            node_type: Optional[str] = None) -> None:
     """Check matching resources when reusing an existing cluster.
 
@@ -739,9 +922,10 @@ def _check_resources_match(backend: backends.Backend,
     Args:
         cluster_name: The name of the cluster.
         task: The task requested to be run on the cluster.
+        handle: The (already refreshed) handle of the cluster, or None if the
+            cluster does not exist.
         node_type: Only used for interactive node. Node type to attach to VM.
     """
-    handle = global_user_state.get_handle_from_cluster_name(cluster_name)
     if handle is None:
         return
 
@@ -790,10 +974,24 @@ def _launch_with_confirm(
         task, _ = backend_utils.check_can_clone_disk_and_override_task(
             clone_disk_from, cluster, task)
 
+    maybe_status, handle = _refresh_cluster_status_handle_cached(cluster)
+    if node_type is not None and maybe_status == status_lib.ClusterStatus.UP:
+        # No need to build a DAG or sky.launch when the interactive node is
+        # already up; only update its idle timeout and autodown.
+        _check_resources_match(backend,
+                               cluster,
+                               task,
+                               handle,
+                               node_type=node_type)
+        if idle_minutes_to_autostop is not None:
+            core.autostop(cluster, idle_minutes_to_autostop, down)
+        elif down:
+            core.autostop(cluster, 1, down)
+        return
+
     with sky.Dag() as dag:
         dag.add(task)
 
-    maybe_status, _ = backend_utils.refresh_cluster_status_handle(cluster)
     if maybe_status is None:
         # Show the optimize log before the prompt if the cluster does not exist.
         try:
@@ -806,7 +1004,7 @@ def _launch_with_confirm(
         dag = sky.optimize(dag)
     task = dag.tasks[0]
 
-    _check_resources_match(backend, cluster, task, node_type=node_type)
+    _check_resources_match(backend, cluster, task, handle, node_type=node_type)
 
     confirm_shown = False
     if not no_confirm:
@@ -828,36 +1026,24 @@ def _launch_with_confirm(
             click.confirm(prompt, default=True, abort=True, show_default=True)
 
     if node_type is not None:
-        if maybe_status != status_lib.ClusterStatus.UP:
-            click.secho(f'Setting up interactive node {cluster}...',
-                        fg='yellow')
-
-        # We do not sky.launch if interactive node is already up, so we need
-        # to update idle timeout and autodown here.
-        elif idle_minutes_to_autostop is not None:
-            core.autostop(cluster, idle_minutes_to_autostop, down)
-        elif down:
-            core.autostop(cluster, 1, down)
-
+        click.secho(f'Setting up interactive node {cluster}...', fg='yellow')
     elif not confirm_shown:
         click.secho(f'Running task on cluster {cluster}...', fg='yellow')
 
-    if node_type is None or maybe_status != status_lib.ClusterStatus.UP:
-        # No need to sky.launch again when interactive node is already up.
-        sky.launch(
-            dag,
-            dryrun=dryrun,
-            stream_logs=True,
-            cluster_name=cluster,
-            detach_setup=detach_setup,
-            detach_run=detach_run,
-            backend=backend,
-            idle_minutes_to_autostop=idle_minutes_to_autostop,
-            down=down,
-            retry_until_up=retry_until_up,
-            no_setup=no_setup,
-            clone_disk_from=clone_disk_from,
-        )
+    sky.launch(
+        dag,
+        dryrun=dryrun,
+        stream_logs=True,
+        cluster_name=cluster,
+        detach_setup=detach_setup,
+        detach_run=detach_run,
+        backend=backend,
+        idle_minutes_to_autostop=idle_minutes_to_autostop,
+        down=down,
+        retry_until_up=retry_until_up,
+        no_setup=no_setup,
+        clone_disk_from=clone_disk_from,
+    )
 
 
 # TODO: skip installing ray to speed up provisioning.
@@ -909,8 +1095,7 @@ def _create_and_ssh_into_node(
                                f'{backends.CloudVmRayBackend.__name__} '
                                f'backend. Got {type(backend).__name__}.')
 
-    maybe_status, handle = backend_utils.refresh_cluster_status_handle(
-        cluster_name)
+    maybe_status, handle = _refresh_cluster_status_handle_cached(cluster_name)
     if maybe_status is not None:
         if user_requested_resources:
             if not resources.less_demanding_than(handle.launched_resources):
@@ -988,6 +1173,21 @@ def _create_and_ssh_into_node(
     click.secho(f'rsync -rP {cluster_name}:/remote/path /local/path', bold=True)
 
 
+def _is_yaml_path(entrypoint: str) -> bool:
+    """Returns whether entrypoint is a single shell token ending in yaml/yml."""
+    yaml_suffixes = ('yaml', '.yml')
+    stripped = entrypoint.strip()
+    # Fast paths that avoid shlex.split. Apart from a YAML suffix, a single
+    # YAML token can only end in a closing quote.
+    if not stripped.endswith(yaml_suffixes + ('"', "'")):
+        return False
+    if (stripped.endswith(yaml_suffixes) and
+            not any(c.isspace() or c in '\'"\\' for c in stripped)):
+        return True
+    shell_splits = shlex.split(entrypoint)
+    return len(shell_splits) == 1 and shell_splits[0].endswith(yaml_suffixes)
+
+
 def _check_yaml(entrypoint: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
     """Checks if entrypoint is a readable YAML file.
 
@@ -997,41 +1197,40 @@ def _check_yaml(entrypoint: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
     is_yaml = True
     config: Optional[List[Dict[str, Any]]] = None
     result = None
-    shell_splits = shlex.split(entrypoint)
-    yaml_file_provided = (len(shell_splits) == 1 and
-                          (shell_splits[0].endswith('yaml') or
-                           shell_splits[0].endswith('.yml')))
+    yaml_file_provided = _is_yaml_path(entrypoint)
+    if not yaml_file_provided and not os.path.isfile(entrypoint):
+        # Most likely an inline command, e.g., 'sky exec c python train.py'.
+        # Existing files are still parsed below, as a YAML need not have a
+        # .yaml suffix.
+        return False, None
     try:
-        with open(entrypoint, 'r') as f:
-            try:
-                config = list(yaml.safe_load_all(f))
-                if config:
-                    # FIXME(zongheng): in a chain DAG YAML it only returns the
-                    # first section. OK for downstream but is weird.
-                    result = config[0]
-                else:
-                    result = {}
-                if isinstance(result, str):
-                    # 'sky exec cluster ./my_script.sh'
-                    is_yaml = False
-            except yaml.YAMLError as e:
-                if yaml_file_provided:
-                    logger.debug(e)
-                    invalid_reason = ('contains an invalid configuration. '
-                                      ' Please check syntax.')
-                is_yaml = False
+        config = common_utils.read_yaml_all(entrypoint)
+        # FIXME(zongheng): in a chain DAG YAML it only returns the
+        # first section. OK for downstream but is weird.
+        result = config[0]
+        if isinstance(result, str):
+            # 'sky exec cluster ./my_script.sh'
+            is_yaml = False
+    except yaml.YAMLError as e:
+        if yaml_file_provided:
+            logger.debug(e)
+            invalid_reason = ('contains an invalid configuration. '
+                              ' Please check syntax.')
+        is_yaml = False
     except OSError:
         if yaml_file_provided:
-            entry_point_path = os.path.expanduser(entrypoint)
-            if not os.path.exists(entry_point_path):
+            try:
+                st_mode = os.stat(os.path.expanduser(entrypoint)).st_mode
+            except OSError:
                 invalid_reason = ('does not exist. Please check if the path'
                                   ' is correct.')
-            elif not os.path.isfile(entry_point_path):
-                invalid_reason = ('is not a file. Please check if the path'
-                                  ' is correct.')
             else:
-                invalid_reason = ('yaml.safe_load() failed. Please check if the'
-                                  ' path is correct.')
+                if not stat.S_ISREG(st_mode):
+                    invalid_reason = ('is not a file. Please check if the path'
+                                      ' is correct.')
+                else:
+                    invalid_reason = ('yaml.safe_load() failed. Please check '
+                                      'if the path is correct.')
         is_yaml = False
     if not is_yaml:
         if yaml_file_provided:
@@ -1146,7 +1345,7 @@ def _make_task_or_dag_from_entrypoint_with_overrides(
     # TODO(wei-lin): move this validation into Python API.
     for resource in task.resources:
         if resource.accelerators is not None:
-            acc, _ = list(resource.accelerators.items())[0]
+            acc, _ = next(iter(resource.accelerators.items()))
             if acc.startswith('tpu-') and task.num_nodes > 1:
                 raise ValueError('Multi-node TPU cluster is not supported. '
                                  f'Got num_nodes={task.num_nodes}.')
@@ -1182,11 +1381,12 @@ def _with_deprecation_warning(f, original_name, alias_name):
 
     @functools.wraps(f)
     def wrapper(self, *args, **kwargs):
-        click.secho(
-            f'WARNING: `{alias_name}` is deprecated and will be removed in a '
-            f'future release. Please use `{original_name}` instead.\n',
-            err=True,
-            fg='yellow')
+        if not env_options.Options.SUPPRESS_DEPRECATION.get():
+            click.secho(
+                f'WARNING: `{alias_name}` is deprecated and will be removed in '
+                f'a future release. Please use `{original_name}` instead.\n',
+                err=True,
+                fg='yellow')
         return f(self, *args, **kwargs)
 
     return wrapper
@@ -1194,7 +1394,9 @@ def _with_deprecation_warning(f, original_name, alias_name):
 
 def _add_command_alias_to_group(group, command, name, hidden):
     """Add a alias of a command to a group."""
-    new_command = copy.deepcopy(command)
+    new_command = copy.copy(command)
+    # Don't share the params list, in case options are added to either one.
+    new_command.params = list(command.params)
     new_command.hidden = hidden
     new_command.name = name
 
@@ -1219,13 +1421,13 @@ def _deprecate_and_hide_command(group, command_to_deprecate,
 
 @click.group(cls=_NaturalOrderGroup, context_settings=_CONTEXT_SETTINGS)
 @click.option('--install-shell-completion',
-              type=click.Choice(['bash', 'zsh', 'fish', 'auto']),
+              type=_SHELL_CHOICE,
               callback=_install_shell_completion,
               expose_value=False,
               is_eager=True,
               help='Install shell completion for the specified shell.')
 @click.option('--uninstall-shell-completion',
-              type=click.Choice(['bash', 'zsh', 'fish', 'auto']),
+              type=_SHELL_CHOICE,
               callback=_uninstall_shell_completion,
               expose_value=False,
               is_eager=True,
@@ -1303,7 +1505,7 @@ def cli():
 @click.option(
     '--disk-tier',
     default=None,
-    type=click.Choice(['low', 'medium', 'high'], case_sensitive=False),
+    type=_DISK_TIER_CHOICE,
     required=False,
     help=(
         'OS disk tier. Could be one of "low", "medium", "high". Default: medium'
@@ -1617,6 +1819,43 @@ def exec(
     sky.exec(task, backend=backend, cluster_name=cluster, detach_run=detach_run)
 
 
+def _load_cached_spot_jobs() -> Optional[List[Dict[str, Any]]]:
+    """Returns the cached in-progress spot jobs, if fresh enough."""
+    try:
+        cache = spot_lib.load_job_table_cache()
+    except (OSError, ValueError):
+        return None
+    if cache is None:
+        return None
+    cached_at, payload = cache
+    if time.time() - cached_at > _SPOT_JOBS_CACHE_TTL_SECONDS:
+        return None
+    return spot_lib.load_spot_job_queue(payload)
+
+
+def _cache_spot_jobs(spot_jobs: List[Dict[str, Any]]) -> None:
+    jobs = [dict(job, status=job['status'].value) for job in spot_jobs]
+    try:
+        spot_lib.dump_job_table_cache(common_utils.encode_payload(jobs))
+    except OSError:
+        # The cache is only an optimization.
+        pass
+
+
+def _get_spot_jobs_not_up_message(
+        controller_status: Optional[status_lib.ClusterStatus]) -> str:
+    """Returns the spot jobs message when the controller is not UP."""
+    if controller_status == status_lib.ClusterStatus.INIT:
+        return ('Controller\'s latest status is INIT; jobs '
+                'will not be shown until it becomes UP.')
+    assert controller_status in [None, status_lib.ClusterStatus.STOPPED]
+    msg = 'No in progress jobs.'
+    if controller_status is None:
+        msg += (f' (See: {colorama.Style.BRIGHT}sky spot -h'
+                f'{colorama.Style.RESET_ALL})')
+    return msg
+
+
 def _get_spot_jobs(
         refresh: bool,
         skip_finished: bool,
@@ -1643,25 +1882,21 @@ def _get_spot_jobs(
         spot job table.
     """
     num_in_progress_jobs = None
+    use_cache = not refresh and skip_finished and not is_called_by_user
     try:
         if not is_called_by_user:
             usage_lib.messages.usage.set_internal()
-        with sky_logging.silent():
-            # Make the call silent
-            spot_jobs = core.spot_queue(refresh=refresh,
-                                        skip_finished=skip_finished)
+        spot_jobs = _load_cached_spot_jobs() if use_cache else None
+        if spot_jobs is None:
+            with sky_logging.silent():
+                # Make the call silent
+                spot_jobs = core.spot_queue(refresh=refresh,
+                                            skip_finished=skip_finished)
+            if use_cache:
+                _cache_spot_jobs(spot_jobs)
         num_in_progress_jobs = len(spot_jobs)
     except exceptions.ClusterNotUpError as e:
-        controller_status = e.cluster_status
-        if controller_status == status_lib.ClusterStatus.INIT:
-            msg = ('Controller\'s latest status is INIT; jobs '
-                   'will not be shown until it becomes UP.')
-        else:
-            assert controller_status in [None, status_lib.ClusterStatus.STOPPED]
-            msg = 'No in progress jobs.'
-            if controller_status is None:
-                msg += (f' (See: {colorama.Style.BRIGHT}sky spot -h'
-                        f'{colorama.Style.RESET_ALL})')
+        msg = _get_spot_jobs_not_up_message(e.cluster_status)
     except RuntimeError as e:
         msg = ('Failed to query spot jobs due to connection '
                'issues. Try again later. '
@@ -1761,7 +1996,11 @@ def _get_services(service_names: Optional[List[str]],
     default=False,
     is_flag=True,
     required=False,
-    help='Query the latest cluster statuses from the cloud provider(s).')
+    help=('Query the latest cluster statuses from the cloud provider(s). '
+          'Clusters refreshed within the last '
+          f'{_STATUS_REFRESH_TTL_ENV_VAR} seconds (default: '
+          f'{_DEFAULT_STATUS_REFRESH_TTL_SECONDS}) are not queried again; set '
+          f'{_STATUS_REFRESH_TTL_ENV_VAR}=0 to always query.'))
 @click.option('--ip',
               default=False,
               is_flag=True,
@@ -1843,14 +2082,32 @@ def status(all: bool, refresh: bool, ip: bool, show_spot_jobs: bool,
       or for autostop-enabled clusters, use ``--refresh`` to query the latest
       cluster statuses from the cloud providers.
     """
-    # Using a pool with 2 worker to run the spot job query and sky serve service
-    # query in parallel to speed up. The pool provides a AsyncResult object that
-    # can be used as a future.
-    with multiprocessing.Pool(2) as pool:
-        # Do not show spot queue if user specifies clusters, and if user
-        # specifies --ip.
-        show_spot_jobs = show_spot_jobs and not clusters and not ip
-        if show_spot_jobs:
+    # Do not show spot queue or services if user specifies clusters, and if
+    # user specifies --ip.
+    show_spot_jobs = show_spot_jobs and not clusters and not ip
+    show_services = show_services and not clusters and not ip
+    # The spot controller is not refreshed when it is STOPPED (see
+    # backend_utils.is_controller_up()), so if the local state says it is
+    # STOPPED or does not exist, the result of the spot job query is known
+    # without querying.
+    spot_jobs_result: Optional[Tuple[Optional[int], str]] = None
+    if show_spot_jobs:
+        spot_controller_record = global_user_state.get_cluster_from_name(
+            spot_lib.SPOT_CONTROLLER_NAME)
+        spot_controller_status = (None if spot_controller_record is None else
+                                  spot_controller_record['status'])
+        if spot_controller_status in [None, status_lib.ClusterStatus.STOPPED]:
+            spot_jobs_result = (
+                None, _get_spot_jobs_not_up_message(spot_controller_status))
+    query_spot_jobs = show_spot_jobs and spot_jobs_result is None
+    # Using a pool with a worker for each of the spot job query and sky serve
+    # service query to run them in parallel to speed up. The pool provides a
+    # AsyncResult object that can be used as a future. The worker processes
+    # are not spawned at all when neither query is needed (e.g., --ip).
+    num_workers = int(query_spot_jobs) + int(show_services)
+    with (multiprocessing.Pool(num_workers)
+          if num_workers > 0 else contextlib.nullcontext()) as pool:
+        if query_spot_jobs:
             # Run the spot job query in parallel to speed up the status query.
             spot_jobs_future = pool.apply_async(
                 _get_spot_jobs,
@@ -1859,7 +2116,6 @@ def status(all: bool, refresh: bool, ip: bool, show_spot_jobs: bool,
                           show_all=False,
                           limit_num_jobs_to_show=not all,
                           is_called_by_user=False))
-        show_services = show_services and not clusters and not ip
         if show_services:
             # Run the sky serve service query in parallel to speed up the
             # status query.
@@ -1890,19 +2146,38 @@ def status(all: bool, refresh: bool, ip: bool, show_spot_jobs: bool,
         query_clusters: Optional[List[str]] = None
         if clusters:
             query_clusters = _get_glob_clusters(clusters, silent=ip)
-        cluster_records = core.status(cluster_names=query_clusters,
-                                      refresh=refresh)
+        if ip:
+            # --ip is never refreshed, so read the records of the queried
+            # clusters directly instead of going through core.status(), which
+            # loads the records of all clusters. Like core.status(), skip
+            # on-prem clusters.
+            assert query_clusters is not None
+            if len(query_clusters) != 1:
+                # A glob matching several clusters (or none): fail before
+                # reading any record.
+                _raise_status_ip_cluster_num_error(len(query_clusters))
+            cluster_records = []
+            for cluster_name in query_clusters:
+                record = global_user_state.get_cluster_from_name(cluster_name)
+                if record is None:
+                    continue
+                launched_resources = getattr(record['handle'],
+                                             'launched_resources', None)
+                if (launched_resources is not None and
+                        isinstance(launched_resources.cloud, clouds.Local)):
+                    continue
+                cluster_records.append(record)
+        else:
+            refresh_max_age_seconds = None
+            if refresh:
+                refresh_max_age_seconds = _get_status_refresh_ttl_seconds()
+            cluster_records = core.status(
+                cluster_names=query_clusters,
+                refresh=refresh,
+                refresh_max_age_seconds=refresh_max_age_seconds)
         if ip:
             if len(cluster_records) != 1:
-                with ux_utils.print_exception_no_traceback():
-                    plural = 's' if len(cluster_records) > 1 else ''
-                    cluster_num = (str(len(cluster_records))
-                                   if len(clusters) > 0 else 'No')
-                    raise ValueError(
-                        _STATUS_IP_CLUSTER_NUM_ERROR_MESSAGE.format(
-                            cluster_num=cluster_num,
-                            plural=plural,
-                            verb='found'))
+                _raise_status_ip_cluster_num_error(len(cluster_records))
             cluster_record = cluster_records[0]
             if cluster_record['status'] != status_lib.ClusterStatus.UP:
                 with ux_utils.print_exception_no_traceback():
@@ -1948,17 +2223,20 @@ def status(all: bool, refresh: bool, ip: bool, show_spot_jobs: bool,
         if show_spot_jobs:
             click.echo(f'\n{colorama.Fore.CYAN}{colorama.Style.BRIGHT}'
                        f'Managed spot jobs{colorama.Style.RESET_ALL}')
-            with rich_utils.safe_status('[cyan]Checking spot jobs[/]'):
-                spot_jobs_query_interrupted, result = _try_get_future_result(
-                    spot_jobs_future)
-                if spot_jobs_query_interrupted:
-                    # Set to -1, so that the controller is not considered
-                    # down, and the hint for showing sky spot queue
-                    # will still be shown.
-                    num_in_progress_jobs = -1
-                    msg = 'KeyboardInterrupt'
-                else:
-                    num_in_progress_jobs, msg = result
+            if spot_jobs_result is not None:
+                num_in_progress_jobs, msg = spot_jobs_result
+            else:
+                with rich_utils.safe_status('[cyan]Checking spot jobs[/]'):
+                    spot_jobs_query_interrupted, result = (
+                        _try_get_future_result(spot_jobs_future))
+                    if spot_jobs_query_interrupted:
+                        # Set to -1, so that the controller is not considered
+                        # down, and the hint for showing sky spot queue
+                        # will still be shown.
+                        num_in_progress_jobs = -1
+                        msg = 'KeyboardInterrupt'
+                    else:
+                        num_in_progress_jobs, msg = result
 
             click.echo(msg)
             if num_in_progress_jobs is not None:
@@ -2001,7 +2279,7 @@ def status(all: bool, refresh: bool, ip: bool, show_spot_jobs: bool,
                 hints.append(controller_utils.Controllers.SKY_SERVE_CONTROLLER.
                              value.in_progress_hint)
 
-        if show_spot_jobs or show_services:
+        if num_workers > 0:
             try:
                 pool.close()
                 pool.join()
@@ -2125,16 +2403,24 @@ def queue(clusters: List[str], skip_finished: bool, all_users: bool):
         clusters = _get_glob_clusters(clusters)
     else:
         show_local_clusters = True
-        cluster_infos = global_user_state.get_clusters()
-        clusters = [c['name'] for c in cluster_infos]
+        clusters = global_user_state.get_cluster_names()
 
-    unsupported_clusters = []
-    for cluster in clusters:
+    def _get_job_queue(
+            cluster: str) -> Tuple[Optional[List[dict]], Optional[Exception]]:
         try:
-            job_table = core.queue(cluster, skip_finished, all_users)
+            return core.queue(cluster, skip_finished, all_users), None
         except (RuntimeError, ValueError, exceptions.NotSupportedError,
                 exceptions.ClusterNotUpError, exceptions.CloudUserIdentityError,
                 exceptions.ClusterOwnerIdentityMismatchError) as e:
+            return None, e
+
+    # Each query is a round trip to the cluster, so query all the clusters in
+    # parallel; the results are still printed in order.
+    job_queues = subprocess_utils.run_in_parallel(_get_job_queue, clusters)
+
+    unsupported_clusters = []
+    for cluster, (job_table, e) in zip(clusters, job_queues):
+        if e is not None:
             if isinstance(e, exceptions.NotSupportedError):
                 unsupported_clusters.append(cluster)
             click.echo(f'{colorama.Fore.YELLOW}Failed to get the job queue for '
@@ -2146,8 +2432,9 @@ def queue(clusters: List[str], skip_finished: bool, all_users: bool):
         click.echo(f'\nJob queue of cluster {cluster}\n{job_table}')
 
     local_clusters = onprem_utils.check_and_get_local_clusters()
+    queried_clusters = set(clusters)
     for local_cluster in local_clusters:
-        if local_cluster not in clusters and show_local_clusters:
+        if local_cluster not in queried_clusters and show_local_clusters:
             click.secho(
                 f'Local cluster {local_cluster} is uninitialized;'
                 ' skipped.',
@@ -2243,13 +2530,13 @@ def logs(
         job_ids_to_query = typing.cast(Optional[List[int]], job_ids)
     if status:
         job_statuses = core.job_status(cluster, job_ids_to_query)
-        job_id = list(job_statuses.keys())[0]
+        job_id = next(iter(job_statuses))
         # If job_ids is None and no job has been submitted to the cluster,
         # it will return {None: None}.
         if job_id is None:
             click.secho(f'No job found on cluster {cluster!r}.', fg='red')
             sys.exit(1)
-        job_status = list(job_statuses.values())[0]
+        job_status = next(iter(job_statuses.values()))
         job_status_str = job_status.value if job_status is not None else 'None'
         click.echo(f'Job {job_id}: {job_status_str}')
         if job_status == job_lib.JobStatus.SUCCEEDED:
@@ -2603,6 +2890,9 @@ def start(
         raise click.UsageError(
             '--idle-minutes-to-autostop must be set if --down is set.')
     to_start = []
+    # Only the names given by the user are globs; the names read from the
+    # cluster table below are already expanded.
+    expand_globs = True
 
     if not clusters and not all:
         # UX: frequently users may have only 1 cluster. In this case, be smart
@@ -2610,6 +2900,7 @@ def start(
         all_cluster_names = global_user_state.get_cluster_names_start_with('')
         if len(all_cluster_names) <= 1:
             clusters = all_cluster_names
+            expand_globs = False
         else:
             raise click.UsageError(
                 '`sky start` requires either a cluster name or glob '
@@ -2621,19 +2912,18 @@ def start(
                        'Letting --all take effect.')
 
         # Get all clusters that are not controllers.
-        clusters = [
-            cluster['name']
-            for cluster in global_user_state.get_clusters()
-            if controller_utils.Controllers.from_name(cluster['name']) is None
-        ]
+        clusters = _get_non_controller_cluster_names(
+            global_user_state.get_cluster_names())
+        expand_globs = False
 
     if not clusters:
         click.echo('Cluster(s) not found (tip: see `sky status`). Do you '
                    'mean to use `sky launch` to provision a new cluster?')
         return
     else:
-        # Get GLOB cluster names
-        clusters = _get_glob_clusters(clusters)
+        if expand_globs:
+            # Get GLOB cluster names
+            clusters = _get_glob_clusters(clusters)
         local_clusters = onprem_utils.check_and_get_local_clusters()
         clusters = [
             c for c in clusters
@@ -2642,9 +2932,26 @@ def start(
                 '`sky start`.'))
         ]
 
-        for name in clusters:
-            cluster_status, _ = backend_utils.refresh_cluster_status_handle(
-                name)
+        status_max_age_seconds = _get_status_refresh_ttl_seconds()
+
+        def _get_cluster_status(
+                name: str) -> Optional[status_lib.ClusterStatus]:
+            # The status is only used to skip UP clusters here; core.start()
+            # refreshes it again before starting the cluster. So a status
+            # refreshed moments ago (e.g., `sky status -r && sky start -a`)
+            # need not be queried from the cloud again.
+            if not force:
+                cluster_status = backend_utils.get_cached_cluster_status(
+                    name, max_age_seconds=status_max_age_seconds)
+                if cluster_status is not None:
+                    return cluster_status
+            return backend_utils.refresh_cluster_status_handle(name)[0]
+
+        # Refreshing a cluster may query its cloud, so refresh all of them in
+        # parallel before going through the statuses in order.
+        cluster_statuses = subprocess_utils.run_in_parallel(
+            _get_cluster_status, clusters)
+        for name, cluster_status in zip(clusters, cluster_statuses):
             # A cluster may have one of the following states:
             #
             #  STOPPED - ok to restart
@@ -2830,14 +3137,17 @@ def _hint_or_raise_for_down_spot_controller(controller_name: str):
         with rich_utils.safe_status(
                 '[bold cyan]Checking for in-progress spot jobs[/]'):
             try:
-                spot_jobs = core.spot_queue(refresh=False)
+                # Only the in-progress jobs matter here; the controller
+                # filters out the (possibly many) finished ones.
+                spot_jobs = core.spot_queue(refresh=False, skip_finished=True)
             except exceptions.ClusterNotUpError:
                 # The spot controller cluster status changed during querying
                 # the spot jobs, use the latest cluster status, so that the
                 # message for INIT and STOPPED states will be correctly
                 # added to the message.
-                cluster_status = backend_utils.refresh_cluster_status_handle(
+                refreshed = backend_utils.refresh_cluster_status_handle(
                     controller_name)
+                cluster_status = refreshed[0]
                 spot_jobs = []
 
         # Find in-progress spot jobs, and hint users to cancel them.
@@ -2912,19 +3222,28 @@ def _down_or_stop_clusters(
     terminated if the cluster name is explicitly and uniquely specified (not
     via glob) and purge is set to True.
     """
+    # The clusters' statuses are about to change.
+    _CLUSTER_STATUS_CACHE.clear()
     if down:
         command = 'down'
     elif idle_minutes_to_autostop is not None:
         command = 'autostop'
     else:
         command = 'stop'
+    # The cluster names, read only where needed (the single-cluster default
+    # and --all); reused by the existence check below while still current.
+    all_cluster_names: Optional[List[str]] = None
+    # Only the names given by the user are globs; the default name below is
+    # read from the cluster table and is already expanded.
+    expand_globs = True
     if not names and apply_to_all is None:
         # UX: frequently users may have only 1 cluster. In this case, 'sky
         # stop/down' without args should be smart and default to that unique
         # choice.
-        all_cluster_names = global_user_state.get_cluster_names_start_with('')
+        all_cluster_names = global_user_state.get_cluster_names()
         if len(all_cluster_names) <= 1:
-            names = all_cluster_names
+            names = list(all_cluster_names)
+            expand_globs = False
         else:
             raise click.UsageError(
                 f'`sky {command}` requires either a cluster name or glob '
@@ -2945,10 +3264,9 @@ def _down_or_stop_clusters(
             if controller_utils.Controllers.from_name(name) is not None
         ]
         controllers_str = ', '.join(map(repr, controllers))
-        names = [
-            name for name in _get_glob_clusters(names)
-            if controller_utils.Controllers.from_name(name) is None
-        ]
+        if expand_globs:
+            names = _get_glob_clusters(names)
+        names = _get_non_controller_cluster_names(names)
         if not down:
             local_clusters = onprem_utils.check_and_get_local_clusters()
             # Local clusters are allowed to `sky down`, but not
@@ -2994,36 +3312,36 @@ def _down_or_stop_clusters(
                 if user_input != confirm_str:
                     raise click.Abort()
                 no_confirm = True
+                # The hint above may have removed the record of a controller
+                # that was already torn down, and the user may have taken a
+                # while at the prompt, so re-read the names below.
+                all_cluster_names = None
         names += controllers
 
     if apply_to_all:
-        all_clusters = global_user_state.get_clusters()
         if len(names) > 0:
             click.echo(
                 f'Both --all and cluster(s) specified for `sky {command}`. '
                 'Letting --all take effect.')
         # We should not remove controllers when --all is specified.
         # Otherwise, it would be very easy to accidentally delete a controller.
-        names = [
-            record['name']
-            for record in all_clusters
-            if controller_utils.Controllers.from_name(record['name']) is None
-        ]
-
-    clusters = []
-    for name in names:
-        handle = global_user_state.get_handle_from_cluster_name(name)
-        if handle is None:
-            # This codepath is used for 'sky down -p <controller>' when the
-            # controller is not in 'sky status'.  Cluster-not-found message
-            # should've been printed by _get_glob_clusters() above.
-            continue
-        clusters.append(name)
+        all_cluster_names = global_user_state.get_cluster_names()
+        names = _get_non_controller_cluster_names(all_cluster_names)
+
+    # Skip the names without a cluster record. This codepath is used for 'sky
+    # down -p <controller>' when the controller is not in 'sky status'.
+    # Cluster-not-found message should've been printed by _get_glob_clusters()
+    # above.
+    if all_cluster_names is None:
+        all_cluster_names = global_user_state.get_cluster_names()
+    existing_cluster_names = set(all_cluster_names)
+    clusters = [name for name in names if name in existing_cluster_names]
     usage_lib.record_cluster_name_for_current_operation(clusters)
 
     if not clusters:
         click.echo('Cluster(s) not found (tip: see `sky status`).')
         return
+    num_threads = min(_get_down_max_parallelism(), len(clusters))
 
     if not no_confirm and len(clusters) > 0:
         cluster_str = 'clusters' if len(clusters) > 1 else 'cluster'
@@ -3091,14 +3409,19 @@ def _down_or_stop_clusters(
                                 f'{colorama.Style.RESET_ALL}')
                 success_progress = True
 
-        progress.stop()
-        click.echo(message)
+        # Print through the progress bar's console, which keeps the bar below
+        # the messages, instead of stopping and restarting the live display
+        # for every cluster. The colors are dropped when not on a terminal,
+        # as click.echo() does.
+        progress.console.print(rich_text.Text.from_ansi(message),
+                               soft_wrap=True)
         if success_progress:
             progress.update(task, advance=1)
-        progress.start()
 
     with progress:
-        subprocess_utils.run_in_parallel(_down_or_stop, clusters)
+        subprocess_utils.run_in_parallel(_down_or_stop,
+                                         clusters,
+                                         num_threads=num_threads)
         progress.live.transient = False
         # Make sure the progress bar not mess up the terminal.
         progress.refresh()
@@ -3152,11 +3475,9 @@ def gpunode(cluster: str, yes: bool, port_forward: Optional[List[int]],
     if name is None:
         name = _default_interactive_node_name('gpunode')
 
-    user_requested_resources = not (cloud is None and region is None and
-                                    zone is None and instance_type is None and
-                                    cpus is None and memory is None and
-                                    gpus is None and use_spot is None)
-    default_resources = _INTERACTIVE_NODE_DEFAULT_RESOURCES['gpunode']
+    user_requested_resources = _is_any_resource_specified(
+        cloud, region, zone, instance_type, cpus, memory, gpus, use_spot)
+    default_resources = _interactive_node_default_resources('gpunode')
     cloud_provider = clouds.CLOUD_REGISTRY.from_str(cloud)
     if gpus is None and instance_type is None:
         # Use this request if both gpus and instance_type are not specified.
@@ -3236,11 +3557,9 @@ def cpunode(cluster: str, yes: bool, port_forward: Optional[List[int]],
     if name is None:
         name = _default_interactive_node_name('cpunode')
 
-    user_requested_resources = not (cloud is None and region is None and
-                                    zone is None and instance_type is None and
-                                    cpus is None and memory is None and
-                                    use_spot is None)
-    default_resources = _INTERACTIVE_NODE_DEFAULT_RESOURCES['cpunode']
+    user_requested_resources = _is_any_resource_specified(
+        cloud, region, zone, instance_type, cpus, memory, use_spot)
+    default_resources = _interactive_node_default_resources('cpunode')
     cloud_provider = clouds.CLOUD_REGISTRY.from_str(cloud)
     if instance_type is None:
         instance_type = default_resources.instance_type
@@ -3318,11 +3637,9 @@ def tpunode(cluster: str, yes: bool, port_forward: Optional[List[int]],
     if name is None:
         name = _default_interactive_node_name('tpunode')
 
-    user_requested_resources = not (region is None and zone is None and
-                                    instance_type is None and cpus is None and
-                                    memory is None and tpus is None and
-                                    use_spot is None)
-    default_resources = _INTERACTIVE_NODE_DEFAULT_RESOURCES['tpunode']
+    user_requested_resources = _is_any_resource_specified(
+        region, zone, instance_type, cpus, memory, tpus, use_spot)
+    default_resources = _interactive_node_default_resources('tpunode')
     accelerator_args = default_resources.accelerator_args
     if tpu_vm:
         accelerator_args['tpu_vm'] = True
@@ -3453,13 +3770,28 @@ def show_gpus(
             ['OTHER_GPU', 'AVAILABLE_QUANTITIES'])
 
         name, quantity = None, None
+        # The offerings of all accelerators, if already listed.
+        all_offerings = None
 
         if accelerator_str is None:
-            result = service_catalog.list_accelerator_counts(
-                gpus_only=True,
-                clouds=cloud,
-                region_filter=region,
-            )
+            if show_all:
+                # The offerings are listed below as well, so query the
+                # catalogs once and derive the available counts from them.
+                all_offerings = service_catalog.list_accelerators(
+                    gpus_only=True,
+                    region_filter=region,
+                    clouds=cloud,
+                    case_sensitive=False)
+                result = {}
+                for gpu, items in all_offerings.items():
+                    result[gpu] = sorted(
+                        {item.accelerator_count for item in items})
+            else:
+                result = service_catalog.list_accelerator_counts(
+                    gpus_only=True,
+                    clouds=cloud,
+                    region_filter=region,
+                )
 
             if len(result) == 0 and cloud == 'kubernetes':
                 yield kubernetes_utils.NO_GPU_ERROR_MESSAGE
@@ -3512,13 +3844,16 @@ def show_gpus(
             else:
                 name, quantity = accelerator_str, None
 
-        # Case-sensitive
-        result = service_catalog.list_accelerators(gpus_only=True,
-                                                   name_filter=name,
-                                                   quantity_filter=quantity,
-                                                   region_filter=region,
-                                                   clouds=cloud,
-                                                   case_sensitive=False)
+        if all_offerings is not None:
+            result = all_offerings
+        else:
+            # Case-insensitive
+            result = service_catalog.list_accelerators(gpus_only=True,
+                                                       name_filter=name,
+                                                       quantity_filter=quantity,
+                                                       region_filter=region,
+                                                       clouds=cloud,
+                                                       case_sensitive=False)
 
         if len(result) == 0:
             if cloud == 'kubernetes':
@@ -3806,7 +4141,7 @@ def spot():
 @click.option(
     '--disk-tier',
     default=None,
-    type=click.Choice(['low', 'medium', 'high'], case_sensitive=False),
+    type=_DISK_TIER_CHOICE,
     required=False,
     help=(
         'OS disk tier. Could be one of "low", "medium", "high". Default: medium'
@@ -4080,14 +4415,9 @@ def spot_cancel(name: Optional[str], job_ids: Tuple[int], all: bool, yes: bool):
       # Cancel managed spot jobs with IDs 1, 2, 3
       $ sky spot cancel 1 2 3
     """
-    _, handle = backend_utils.is_controller_up(
-        controller_type=controller_utils.Controllers.SPOT_CONTROLLER,
-        stopped_message='All managed spot jobs should have finished.')
-    if handle is None:
-        # Hint messages already printed by the call above.
-        sys.exit(1)
-
     job_id_str = ','.join(map(str, job_ids))
+    # Validate the arguments before checking the controller, which may query
+    # the cloud for the controller's status.
     if sum([len(job_ids) > 0, name is not None, all]) != 1:
         argument_str = f'--job-ids {job_id_str}' if len(job_ids) > 0 else ''
         argument_str += f' --name {name}' if name is not None else ''
@@ -4096,6 +4426,13 @@ def spot_cancel(name: Optional[str], job_ids: Tuple[int], all: bool, yes: bool):
             'Can only specify one of JOB_IDS or --name or --all. '
             f'Provided {argument_str!r}.')
 
+    _, handle = backend_utils.is_controller_up(
+        controller_type=controller_utils.Controllers.SPOT_CONTROLLER,
+        stopped_message='All managed spot jobs should have finished.')
+    if handle is None:
+        # Hint messages already printed by the call above.
+        sys.exit(1)
+
     if not yes:
         job_identity_str = (f'managed spot jobs with IDs {job_id_str}'
                             if job_ids else repr(name))
@@ -4144,6 +4481,25 @@ def spot_logs(name: Optional[str], job_id: Optional[int], follow: bool,
         sys.exit(1)
 
 
+def _wait_for_port_forwarding(ssh_process: subprocess.Popen,
+                              local_port: int,
+                              timeout: float = 3) -> None:
+    """Waits until the local end of an `ssh -L` port forwarding accepts.
+
+    Returns early if the ssh process exits, and after `timeout` seconds at the
+    latest.
+    """
+    deadline = time.time() + timeout
+    backoff = 0.02
+    while time.time() < deadline and ssh_process.poll() is None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(0.1)
+            if s.connect_ex(('127.0.0.1', local_port)) == 0:
+                return
+        time.sleep(min(backoff, max(deadline - time.time(), 0)))
+        backoff = min(backoff * 2, 0.2)
+
+
 @spot.command('dashboard', cls=_DocumentedCodeCommand)
 @click.option(
     '--port',
@@ -4156,6 +4512,8 @@ def spot_logs(name: Optional[str], job_id: Optional[int], follow: bool,
 @usage_lib.entrypoint
 def spot_dashboard(port: Optional[int]):
     """Opens a dashboard for spot jobs (needs controller to be UP)."""
+    import webbrowser  # pylint: disable=import-outside-toplevel
+
     # TODO(zongheng): ideally, the controller/dashboard server should expose the
     # API perhaps via REST. Then here we would (1) not have to use SSH to try to
     # see if the controller is UP first, which is slow; (2) not have to run SSH
@@ -4177,14 +4535,17 @@ def spot_dashboard(port: Optional[int]):
         free_port = common_utils.find_free_port(remote_port)
     else:
         free_port = port
-    ssh_command = (f'ssh -qNL {free_port}:localhost:{remote_port} '
-                   f'{spot_lib.SPOT_CONTROLLER_NAME}')
+    ssh_command = [
+        'ssh', '-qNL', f'{free_port}:localhost:{remote_port}',
+        spot_lib.SPOT_CONTROLLER_NAME
+    ]
     click.echo('Forwarding port: ', nl=False)
-    click.secho(f'{ssh_command}', dim=True)
+    click.secho(' '.join(ssh_command), dim=True)
 
-    with subprocess.Popen(ssh_command, shell=True,
-                          start_new_session=True) as ssh_process:
-        time.sleep(3)  # Added delay for ssh_command to initialize.
+    # Run ssh directly rather than through a shell, so that no intermediate
+    # /bin/sh process is spawned.
+    with subprocess.Popen(ssh_command, start_new_session=True) as ssh_process:
+        _wait_for_port_forwarding(ssh_process, free_port)
         webbrowser.open(f'http://localhost:{free_port}')
         click.secho(
             f'Dashboard is now available at: http://127.0.0.1:{free_port}',
@@ -4590,8 +4951,9 @@ def serve_logs(
 
 
 @ux_utils.print_exception_no_traceback()
-def _get_candidate_configs(yaml_path: str) -> Optional[List[Dict[str, str]]]:
-    """Gets benchmark candidate configs from a YAML file.
+def _get_candidate_configs(config: Any,
+                           yaml_path: str) -> Optional[List[Dict[str, str]]]:
+    """Gets benchmark candidate configs from a parsed YAML file.
 
     Benchmark candidates are configured in the YAML file as a list of
     dictionaries. Each dictionary defines a candidate config
@@ -4603,8 +4965,11 @@ def _get_candidate_configs(yaml_path: str) -> Optional[List[Dict[str, str]]]:
         - {accelerators: K80}
         - {instance_type: g4dn.2xlarge}
         - {cloud: gcp, accelerators: V100} # overrides cloud
+
+    Args:
+        config: The config parsed from the YAML file.
+        yaml_path: Path to the YAML file, for error messages.
     """
-    config = common_utils.read_yaml(os.path.expanduser(yaml_path))
     if not isinstance(config, dict):
         raise ValueError(f'Invalid YAML file: {yaml_path}. '
                          'The YAML file should be parsed into a dictionary.')
@@ -4660,7 +5025,7 @@ def _get_candidate_configs(yaml_path: str) -> Optional[List[Dict[str, str]]]:
 @click.option(
     '--disk-tier',
     default=None,
-    type=click.Choice(['low', 'medium', 'high'], case_sensitive=False),
+    type=_DISK_TIER_CHOICE,
     required=False,
     help=(
         'OS disk tier. Could be one of "low", "medium", "high". Default: medium'
@@ -4712,6 +5077,10 @@ def benchmark_launch(
     Alternatively, specify the benchmarking resources in your YAML (see doc),
     which allows benchmarking on many more resource fields.
     """
+    # pylint: disable=import-outside-toplevel
+    from sky.benchmark import benchmark_state
+    from sky.benchmark import benchmark_utils
+
     env = _merge_env_vars(env_file, env)
     record = benchmark_state.get_benchmark_from_name(benchmark)
     if record is not None:
@@ -4733,47 +5102,35 @@ def benchmark_launch(
     click.secho('Benchmarking a task from YAML spec: ', fg='yellow', nl=False)
     click.secho(entrypoint, bold=True)
 
-    candidates = _get_candidate_configs(entrypoint)
+    candidates = _get_candidate_configs(config, entrypoint)
     # Check if the candidate configs are specified in both CLI and YAML.
     if candidates is not None:
         message = ('is specified in both CLI and resources.candidates '
                    'in the YAML. Please specify only one of them.')
-        if cloud is not None:
-            if any('cloud' in candidate for candidate in candidates):
-                raise click.BadParameter(f'cloud {message}')
-        if region is not None:
-            if any('region' in candidate for candidate in candidates):
-                raise click.BadParameter(f'region {message}')
-        if zone is not None:
-            if any('zone' in candidate for candidate in candidates):
-                raise click.BadParameter(f'zone {message}')
-        if gpus is not None:
-            if any('accelerators' in candidate for candidate in candidates):
-                raise click.BadParameter(f'gpus (accelerators) {message}')
-        if use_spot is not None:
-            if any('use_spot' in candidate for candidate in candidates):
-                raise click.BadParameter(f'use_spot {message}')
-        if image_id is not None:
-            if any('image_id' in candidate for candidate in candidates):
-                raise click.BadParameter(f'image_id {message}')
-        if disk_size is not None:
-            if any('disk_size' in candidate for candidate in candidates):
-                raise click.BadParameter(f'disk_size {message}')
-        if disk_tier is not None:
-            if any('disk_tier' in candidate for candidate in candidates):
-                raise click.BadParameter(f'disk_tier {message}')
-        if ports:
-            if any('ports' in candidate for candidate in candidates):
-                raise click.BadParameter(f'ports {message}')
+        candidate_keys = set().union(*candidates)
+        # (Option name, key in the candidates, value from the CLI.)
+        cli_overrides = [
+            ('cloud', 'cloud', cloud),
+            ('region', 'region', region),
+            ('zone', 'zone', zone),
+            ('gpus (accelerators)', 'accelerators', gpus),
+            ('use_spot', 'use_spot', use_spot),
+            ('image_id', 'image_id', image_id),
+            ('disk_size', 'disk_size', disk_size),
+            ('disk_tier', 'disk_tier', disk_tier),
+            ('ports', 'ports', ports if ports else None),
+        ]
+        for option, key, value in cli_overrides:
+            if value is not None and key in candidate_keys:
+                raise click.BadParameter(f'{option} {message}')
 
     # The user can specify the benchmark candidates in either of the two ways:
     # 1. By specifying resources.candidates in the YAML.
     # 2. By specifying gpu types as a command line argument (--gpus).
     override_gpu = None
     if gpus is not None:
-        gpu_list = gpus.split(',')
-        gpu_list = [gpu.strip() for gpu in gpu_list]
-        if ' ' in gpus:
+        gpu_list = [gpu.strip() for gpu in gpus.split(',')]
+        if ' ' in gpus or '' in gpu_list:
             raise click.BadParameter('Remove blanks in --gpus.')
 
         if len(gpu_list) == 1:
@@ -4815,18 +5172,9 @@ def benchmark_launch(
         cloud = resources_config.pop('cloud')
         if cloud is not None:
             resources_config['cloud'] = str(cloud)
-    if 'region' in resources_config:
-        if resources_config['region'] is None:
-            resources_config.pop('region')
-    if 'zone' in resources_config:
-        if resources_config['zone'] is None:
-            resources_config.pop('zone')
-    if 'accelerators' in resources_config:
-        if resources_config['accelerators'] is None:
-            resources_config.pop('accelerators')
-    if 'image_id' in resources_config:
-        if resources_config['image_id'] is None:
-            resources_config.pop('image_id')
+    for key in ('region', 'zone', 'accelerators', 'image_id'):
+        if key in resources_config and resources_config[key] is None:
+            resources_config.pop(key)
 
     # Fully generate the benchmark candidate configs.
     clusters, candidate_configs = benchmark_utils.generate_benchmark_configs(
@@ -4875,6 +5223,9 @@ def benchmark_launch(
 @usage_lib.entrypoint
 def benchmark_ls() -> None:
     """List the benchmark history."""
+    # pylint: disable=import-outside-toplevel
+    from sky.benchmark import benchmark_state
+
     benchmarks = benchmark_state.get_benchmarks()
     columns = [
         'BENCHMARK',
@@ -4882,10 +5233,12 @@ def benchmark_ls() -> None:
         'LAUNCHED',
     ]
 
+    # Fetch the results of all benchmarks at once; they are used both for the
+    # number of columns and for the rows below.
+    results_by_name = benchmark_state.get_all_benchmark_results()
     max_num_candidates = 1
     for benchmark in benchmarks:
-        benchmark_results = benchmark_state.get_benchmark_results(
-            benchmark['name'])
+        benchmark_results = results_by_name.get(benchmark['name'], [])
         num_candidates = len(benchmark_results)
         if num_candidates > max_num_candidates:
             max_num_candidates = num_candidates
@@ -4910,8 +5263,7 @@ def benchmark_ls() -> None:
             datetime.datetime.fromtimestamp(benchmark['launched_at']),
         ]
 
-        benchmark_results = benchmark_state.get_benchmark_results(
-            benchmark['name'])
+        benchmark_results = results_by_name.get(benchmark['name'], [])
         # RESOURCES
         for b in benchmark_results:
             num_nodes = b['num_nodes']
@@ -4921,7 +5273,7 @@ def benchmark_ls() -> None:
             if resources.accelerators is None:
                 accelerators = ''
             else:
-                accelerator, count = list(resources.accelerators.items())[0]
+                accelerator, count = next(iter(resources.accelerators.items()))
                 accelerators = f' ({accelerator}:{count})'
             # For brevity, skip the cloud names.
             resources_str = f'{num_nodes}x {instance_type}{accelerators}'
@@ -4941,6 +5293,10 @@ def benchmark_ls() -> None:
 @usage_lib.entrypoint
 def benchmark_show(benchmark: str) -> None:
     """Show a benchmark report."""
+    # pylint: disable=import-outside-toplevel
+    from sky.benchmark import benchmark_state
+    from sky.benchmark import benchmark_utils
+
     record = benchmark_state.get_benchmark_from_name(benchmark)
     if record is None:
         raise click.BadParameter(f'Benchmark {benchmark} does not exist.')
@@ -5085,16 +5441,20 @@ def benchmark_down(
     yes: bool,
 ) -> None:
     """Tear down all clusters belonging to a benchmark."""
+    # pylint: disable=import-outside-toplevel
+    from sky.benchmark import benchmark_state
+
     record = benchmark_state.get_benchmark_from_name(benchmark)
     if record is None:
         raise click.BadParameter(f'Benchmark {benchmark} does not exist.')
 
     clusters = benchmark_state.get_benchmark_clusters(benchmark)
+    existing_clusters = set(global_user_state.get_cluster_names())
     to_stop: List[str] = []
     for cluster in clusters:
         if cluster in clusters_to_exclude:
             continue
-        if global_user_state.get_cluster_from_name(cluster) is None:
+        if cluster not in existing_clusters:
             continue
         to_stop.append(cluster)
 
@@ -5122,23 +5482,30 @@ def benchmark_down(
 def benchmark_delete(benchmarks: Tuple[str], all: Optional[bool],
                      yes: bool) -> None:
     """Delete benchmark reports from the history."""
+    # pylint: disable=import-outside-toplevel
+    from sky.benchmark import benchmark_state
+    from sky.benchmark import benchmark_utils
+
     if not benchmarks and all is None:
         raise click.BadParameter(
             'Either specify benchmarks or use --all to delete all benchmarks.')
     to_delete = []
-    if len(benchmarks) > 0:
+    if all:
+        to_delete = benchmark_state.get_benchmarks()
+        if len(benchmarks) > 0:
+            print('Both --all and benchmark(s) specified '
+                  'for sky bench delete. Letting --all take effect.')
+    else:
         for benchmark in benchmarks:
             record = benchmark_state.get_benchmark_from_name(benchmark)
             if record is None:
                 print(f'Benchmark {benchmark} not found.')
             else:
                 to_delete.append(record)
-    if all:
-        to_delete = benchmark_state.get_benchmarks()
-        if len(benchmarks) > 0:
-            print('Both --all and benchmark(s) specified '
-                  'for sky bench delete. Letting --all take effect.')
 
+    # Reuse the fetched records for the bucket names, instead of querying
+    # each benchmark again in _delete_benchmark.
+    bucket_names = {r['name']: r['bucket'] for r in to_delete}
     to_delete = [r['name'] for r in to_delete]
     if not to_delete:
         return
@@ -5159,13 +5526,14 @@ def benchmark_delete(benchmarks: Tuple[str], all: Optional[bool],
         f'[bold cyan]Deleting {len(to_delete)} benchmark{plural}: ',
         total=len(to_delete))
 
+    # Look up the existing clusters once, instead of querying each benchmark
+    # cluster separately.
+    existing_clusters = set(global_user_state.get_cluster_names())
+
     def _delete_benchmark(benchmark: str) -> None:
         clusters = benchmark_state.get_benchmark_clusters(benchmark)
-        records = []
-        for cluster in clusters:
-            record = global_user_state.get_cluster_from_name(cluster)
-            records.append(record)
-        num_clusters = len([r for r in records if r is not None])
+        num_clusters = len(
+            [cluster for cluster in clusters if cluster in existing_clusters])
 
         if num_clusters > 0:
             plural = 's' if num_clusters > 1 else ''
@@ -5177,11 +5545,10 @@ def benchmark_delete(benchmarks: Tuple[str], all: Optional[bool],
                        'before deleting the benchmark report.')
             success = False
         else:
-            bucket_name = benchmark_state.get_benchmark_from_name(
-                benchmark)['bucket']
+            bucket_name = bucket_names[benchmark]
             handle = global_user_state.get_handle_from_storage_name(bucket_name)
             assert handle is not None, bucket_name
-            bucket_type = list(handle.sky_stores.keys())[0]
+            bucket_type = next(iter(handle.sky_stores))
             benchmark_utils.remove_benchmark_logs(benchmark, bucket_name,
                                                   bucket_type)
             benchmark_state.delete_benchmark(benchmark)
@@ -5189,11 +5556,12 @@ def benchmark_delete(benchmarks: Tuple[str], all: Optional[bool],
                        f'{benchmark} deleted.{colorama.Style.RESET_ALL}')
             success = True
 
-        progress.stop()
-        click.secho(message)
+        # Print through the progress bar's console instead of stopping and
+        # restarting the live display for every benchmark.
+        progress.console.print(rich_text.Text.from_ansi(message),
+                               soft_wrap=True)
         if success:
             progress.update(task, advance=1)
-        progress.start()
 
     with progress:
         subprocess_utils.run_in_parallel(_delete_benchmark, to_delete)
@@ -5222,14 +5590,11 @@ def local_up():
                 '\nWill automatically switch to kind-skypilot after the local '
                 'cluster is created.')
     with rich_utils.safe_status('Creating local cluster...'):
-        path_to_package = os.path.dirname(os.path.dirname(__file__))
-        up_script_path = os.path.join(path_to_package, 'sky/utils/kubernetes',
-                                      'create_cluster.sh')
-        # Get directory of script and run it from there
-        cwd = os.path.dirname(os.path.abspath(up_script_path))
-        # Run script and don't print output
+        # Run script from its directory and don't print output
         try:
-            subprocess_utils.run(up_script_path, cwd=cwd, capture_output=True)
+            subprocess_utils.run(_LOCAL_UP_SCRIPT_PATH,
+                                 cwd=_LOCAL_CLUSTER_SCRIPTS_DIR,
+                                 capture_output=True)
             cluster_created = True
         except subprocess.CalledProcessError as e:
             # Check if return code is 100
@@ -5269,11 +5634,8 @@ def local_down():
     """Deletes a local cluster."""
     cluster_removed = False
     with rich_utils.safe_status('Removing local cluster...'):
-        path_to_package = os.path.dirname(os.path.dirname(__file__))
-        down_script_path = os.path.join(path_to_package, 'sky/utils/kubernetes',
-                                        'delete_cluster.sh')
         try:
-            subprocess_utils.run(down_script_path, capture_output=True)
+            subprocess_utils.run(_LOCAL_DOWN_SCRIPT_PATH, capture_output=True)
             cluster_removed = True
         except subprocess.CalledProcessError as e:
             # Check if return code is 100
@@ -1,13 +1,17 @@
 """Service catalog."""
 import collections
+import contextlib
 import importlib
 import typing
 from typing import Dict, List, Optional, Set, Tuple, Union
 
+from sky import sky_logging
+from sky.clouds.service_catalog import config
 from sky.clouds.service_catalog.config import fallback_to_default_catalog
 from sky.clouds.service_catalog.constants import CATALOG_SCHEMA_VERSION
 from sky.clouds.service_catalog.constants import HOSTED_CATALOG_DIR_URL
 from sky.clouds.service_catalog.constants import LOCAL_CATALOG_DIR
+from sky.utils import subprocess_utils
 
 if typing.TYPE_CHECKING:
     from sky.clouds import cloud
@@ -19,6 +23,10 @@ ALL_CLOUDS = ('aws', 'azure', 'gcp', 'ibm', 'lambda', 'scp', 'oci',
 
 
 def _map_clouds_catalog(clouds: CloudFilter, method_name: str, *args, **kwargs):
+    # Listing the accelerators of all clouds (`sky show-gpus`) loads every
+    # catalog, which may download it or query the cloud (e.g., the GPUs of a
+    # Kubernetes cluster), so query the clouds in parallel in that case.
+    parallel = clouds is None and method_name == 'list_accelerators'
     if clouds is None:
         clouds = list(ALL_CLOUDS)
 
@@ -32,8 +40,7 @@ def _map_clouds_catalog(clouds: CloudFilter, method_name: str, *args, **kwargs):
     if single:
         clouds = [clouds]  # type: ignore
 
-    results = []
-    for cloud in clouds:
+    def _execute_catalog_method(cloud: str):
         try:
             cloud_module = importlib.import_module(
                 f'sky.clouds.service_catalog.{cloud}_catalog')
@@ -47,7 +54,27 @@ def _map_clouds_catalog(clouds: CloudFilter, method_name: str, *args, **kwargs):
             raise AttributeError(
                 f'Module "{cloud}_catalog" does not '
                 f'implement the "{method_name}" method') from None
-        results.append(method(*args, **kwargs))
+        return method(*args, **kwargs)
+
+    if parallel:
+        # The catalog config and the silent state of the logging are
+        # thread-local, so pass the caller's settings on to the threads
+        # querying the catalogs.
+        use_default_catalog_if_failed = (
+            config.get_use_default_catalog_if_failed())
+        is_silent = sky_logging.is_silent()
+
+        def _execute_catalog_method_in_thread(cloud: str):
+            silent = (sky_logging.silent()
+                      if is_silent else contextlib.nullcontext())
+            with config.set_use_default_catalog_if_failed(
+                    use_default_catalog_if_failed), silent:
+                return _execute_catalog_method(cloud)
+
+        results = subprocess_utils.run_in_parallel(
+            _execute_catalog_method_in_thread, clouds)
+    else:
+        results = [_execute_catalog_method(cloud) for cloud in clouds]
     if single:
         return results[0]
     return results
@@ -35,8 +35,11 @@ logger = sky_logging.init_logger(__name__)
 
 
 @usage_lib.entrypoint
-def status(cluster_names: Optional[Union[str, List[str]]] = None,
-           refresh: bool = False) -> List[Dict[str, Any]]:
+def status(
+        cluster_names: Optional[Union[str, List[str]]] = None,
+        refresh: bool = False,
+        refresh_max_age_seconds: Optional[float] = None
+) -> List[Dict[str, Any]]:
     # NOTE(dev): Keep the docstring consistent between the Python API and CLI.
     """Get cluster statuses.
 
@@ -99,15 +102,21 @@ def status(cluster_names: Optional[Union[str, List[str]]] = None,
             provided, all clusters will be queried.
         refresh: whether to query the latest cluster statuses from the cloud
             provider(s).
+        refresh_max_age_seconds: if set with refresh=True, clusters whose
+            status was updated within this many seconds are not queried again
+            (clusters that are in INIT or were just launched use a shorter
+            window).
 
     Returns:
         A list of dicts, with each dict containing the information of a
         cluster. If a cluster is found to be terminated or not found, it will
         be omitted from the returned list.
     """
-    return backend_utils.get_clusters(include_controller=True,
-                                      refresh=refresh,
-                                      cluster_names=cluster_names)
+    return backend_utils.get_clusters(
+        include_controller=True,
+        refresh=refresh,
+        cluster_names=cluster_names,
+        refresh_max_age_seconds=refresh_max_age_seconds)
 
 
 @usage_lib.entrypoint
@@ -827,7 +836,7 @@ def spot_queue(refresh: bool,
     backend = backend_utils.get_backend_from_handle(handle)
     assert isinstance(backend, backends.CloudVmRayBackend)
 
-    code = spot.SpotCodeGen.get_job_table()
+    code = spot.SpotCodeGen.get_job_table(skip_finished=skip_finished)
     returncode, job_table_payload, stderr = backend.run_on_head(
         handle,
         code,
@@ -845,13 +854,9 @@ def spot_queue(refresh: bool,
 
     jobs = spot.load_spot_job_queue(job_table_payload)
     if skip_finished:
-        # Filter out the finished jobs. If a multi-task job is partially
-        # finished, we will include all its tasks.
-        non_finished_tasks = list(
-            filter(lambda job: not job['status'].is_terminal(), jobs))
-        non_finished_job_ids = {job['job_id'] for job in non_finished_tasks}
-        jobs = list(
-            filter(lambda job: job['job_id'] in non_finished_job_ids, jobs))
+        # The controller has already filtered out the finished jobs, unless it
+        # was launched by an older SkyPilot.
+        jobs = spot.filter_unfinished_jobs(jobs)
     return jobs
 
 
@@ -903,6 +908,9 @@ def spot_cancel(name: Optional[str] = None,
                                                 code,
                                                 require_outputs=True,
                                                 stream_logs=False)
+    # Some jobs may have been cancelled even if the command failed, so the
+    # jobs cached by `sky status` are stale either way.
+    spot.clear_job_table_cache()
     try:
         subprocess_utils.handle_returncode(returncode, code,
                                            'Failed to cancel managed spot job',
@@ -702,12 +702,17 @@ def spot_launch(
               f'Launching managed spot job {dag.name!r} from spot controller...'
               f'{colorama.Style.RESET_ALL}')
         print('Launching spot controller...')
-        execute(
-            entrypoint=controller_task,
-            stream_logs=stream_logs,
-            cluster_name=controller_name,
-            detach_run=detach_run,
-            idle_minutes_to_autostop=constants.
-            CONTROLLER_IDLE_MINUTES_TO_AUTOSTOP,
-            retry_until_up=True,
-        )
+        try:
+            execute(
+                entrypoint=controller_task,
+                stream_logs=stream_logs,
+                cluster_name=controller_name,
+                detach_run=detach_run,
+                idle_minutes_to_autostop=constants.
+                CONTROLLER_IDLE_MINUTES_TO_AUTOSTOP,
+                retry_until_up=True,
+            )
+        finally:
+            # The job may have been submitted even if the log streaming was
+            # interrupted, so drop the jobs cached by `sky status`.
+            spot.clear_job_table_cache()
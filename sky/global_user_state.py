@@ -113,6 +113,11 @@ def create_table(cursor, conn):
     db_utils.add_column_to_table(cursor, conn, 'clusters',
                                  'storage_mounts_metadata', 'BLOB DEFAULT null')
 
+    # Timestamp of the last time the status was set, either by an operation on
+    # the cluster or by a refresh from the cloud provider.
+    db_utils.add_column_to_table(cursor, conn, 'clusters', 'status_updated_at',
+                                 'INTEGER DEFAULT null')
+
     conn.commit()
 
 
@@ -174,7 +179,7 @@ def add_or_update_cluster(cluster_name: str,
         # specified.
         '(name, launched_at, handle, last_use, status, '
         'autostop, to_down, metadata, owner, cluster_hash, '
-        'storage_mounts_metadata) '
+        'storage_mounts_metadata, status_updated_at) '
         'VALUES ('
         # name
         '?, '
@@ -209,7 +214,9 @@ def add_or_update_cluster(cluster_name: str,
         '?,'
         # storage_mounts_metadata
         'COALESCE('
-        '(SELECT storage_mounts_metadata FROM clusters WHERE name=?), null)'
+        '(SELECT storage_mounts_metadata FROM clusters WHERE name=?), null), '
+        # status_updated_at
+        '?'
         ')',
         (
             # name
@@ -238,6 +245,8 @@ def add_or_update_cluster(cluster_name: str,
             cluster_hash,
             # storage_mounts_metadata
             cluster_name,
+            # status_updated_at
+            int(time.time()),
         ))
 
     launched_nodes = getattr(cluster_handle, 'launched_nodes', None)
@@ -309,10 +318,11 @@ def remove_cluster(cluster_name: str, terminate: bool) -> None:
         if hasattr(handle, 'stable_internal_external_ips'):
             handle.stable_internal_external_ips = None
         _DB.cursor.execute(
-            'UPDATE clusters SET handle=(?), status=(?) '
-            'WHERE name=(?)', (
+            'UPDATE clusters SET handle=(?), status=(?), '
+            'status_updated_at=(?) WHERE name=(?)', (
                 pickle.dumps(handle),
                 status_lib.ClusterStatus.STOPPED.value,
+                int(time.time()),
                 cluster_name,
             ))
     _DB.conn.commit()
@@ -335,12 +345,42 @@ def get_glob_cluster_names(cluster_name: str) -> List[str]:
     return [row[0] for row in rows]
 
 
+def _get_glob_names_many(table: str,
+                         patterns: List[str]) -> Dict[str, List[str]]:
+    """Matches all glob patterns against a table's names in one query."""
+    matches: Dict[str, List[str]] = {pattern: [] for pattern in patterns}
+    if not matches:
+        return matches
+    values = ', '.join(['(?)'] * len(matches))
+    rows = _DB.cursor.execute(
+        f'WITH patterns(pattern) AS (VALUES {values}) '
+        f'SELECT pattern, name FROM patterns JOIN {table} '
+        f'ON {table}.name GLOB patterns.pattern', list(matches))
+    for pattern, name in rows:
+        matches[pattern].append(name)
+    return matches
+
+
+def get_glob_cluster_names_many(
+        cluster_names: List[str]) -> Dict[str, List[str]]:
+    """Returns the cluster names matching each of the glob patterns.
+
+    Equivalent to calling get_glob_cluster_names() on each pattern, but
+    with a single query to the database.
+    """
+    assert None not in cluster_names, 'cluster_name cannot be None'
+    return _get_glob_names_many('clusters', cluster_names)
+
+
 def set_cluster_status(cluster_name: str,
                        status: status_lib.ClusterStatus) -> None:
-    _DB.cursor.execute('UPDATE clusters SET status=(?) WHERE name=(?)', (
-        status.value,
-        cluster_name,
-    ))
+    _DB.cursor.execute(
+        'UPDATE clusters SET status=(?), status_updated_at=(?) '
+        'WHERE name=(?)', (
+            status.value,
+            int(time.time()),
+            cluster_name,
+        ))
     count = _DB.cursor.rowcount
     _DB.conn.commit()
     assert count <= 1, count
@@ -555,7 +595,8 @@ def get_cluster_from_name(
         # we can add new fields to the database in the future without
         # breaking the previous code.
         (name, launched_at, handle, last_use, status, autostop, metadata,
-         to_down, owner, cluster_hash, storage_mounts_metadata) = row[:11]
+         to_down, owner, cluster_hash, storage_mounts_metadata,
+         status_updated_at) = row[:12]
         # TODO: use namedtuple instead of dict
         record = {
             'name': name,
@@ -570,6 +611,7 @@ def get_cluster_from_name(
             'cluster_hash': cluster_hash,
             'storage_mounts_metadata':
                 _load_storage_mounts_metadata(storage_mounts_metadata),
+            'status_updated_at': status_updated_at,
         }
         return record
     return None
@@ -581,7 +623,8 @@ def get_clusters() -> List[Dict[str, Any]]:
     records = []
     for row in rows:
         (name, launched_at, handle, last_use, status, autostop, metadata,
-         to_down, owner, cluster_hash, storage_mounts_metadata) = row[:11]
+         to_down, owner, cluster_hash, storage_mounts_metadata,
+         status_updated_at) = row[:12]
         # TODO: use namedtuple instead of dict
         record = {
             'name': name,
@@ -596,12 +639,24 @@ def get_clusters() -> List[Dict[str, Any]]:
             'cluster_hash': cluster_hash,
             'storage_mounts_metadata':
                 _load_storage_mounts_metadata(storage_mounts_metadata),
+            'status_updated_at': status_updated_at,
         }
 
         records.append(record)
     return records
 
 
+def get_cluster_names() -> List[str]:
+    """Returns the names of all clusters, in the order of get_clusters().
+
+    Cheaper than get_clusters() when only the names are needed, as the
+    handles are not unpickled.
+    """
+    rows = _DB.cursor.execute(
+        'SELECT name FROM clusters ORDER BY launched_at DESC')
+    return [row[0] for row in rows]
+
+
 def get_clusters_from_history() -> List[Dict[str, Any]]:
     rows = _DB.cursor.execute(
         'SELECT ch.cluster_hash, ch.name, ch.num_nodes, '
@@ -770,6 +825,17 @@ def get_glob_storage_name(storage_name: str) -> List[str]:
     return [row[0] for row in rows]
 
 
+def get_glob_storage_names_many(
+        storage_names: List[str]) -> Dict[str, List[str]]:
+    """Returns the storage names matching each of the glob patterns.
+
+    Equivalent to calling get_glob_storage_name() on each pattern, but with
+    a single query to the database.
+    """
+    assert None not in storage_names, 'storage_name cannot be None'
+    return _get_glob_names_many('storage', storage_names)
+
+
 def get_storage_names_start_with(starts_with: str) -> List[str]:
     rows = _DB.cursor.execute('SELECT name FROM storage WHERE name LIKE (?)',
                               (f'{starts_with}%',))
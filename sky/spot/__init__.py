@@ -7,8 +7,10 @@ from sky.spot.constants import SPOT_CONTROLLER_YAML_PREFIX
 from sky.spot.constants import SPOT_TASK_YAML_PREFIX
 from sky.spot.recovery_strategy import SPOT_DEFAULT_STRATEGY
 from sky.spot.recovery_strategy import SPOT_STRATEGIES
+from sky.spot.spot_utils import clear_job_table_cache
 from sky.spot.spot_utils import dump_job_table_cache
 from sky.spot.spot_utils import dump_spot_job_queue
+from sky.spot.spot_utils import filter_unfinished_jobs
 from sky.spot.spot_utils import format_job_table
 from sky.spot.spot_utils import load_job_table_cache
 from sky.spot.spot_utils import load_spot_job_queue
@@ -27,9 +29,11 @@ __all__ = [
     'SPOT_TASK_YAML_PREFIX',
     # utils
     'SpotCodeGen',
+    'clear_job_table_cache',
     'dump_job_table_cache',
     'load_job_table_cache',
     'format_job_table',
     'dump_spot_job_queue',
+    'filter_unfinished_jobs',
     'load_spot_job_queue',
 ]
@@ -447,8 +447,23 @@ def stream_logs_by_name(job_name: str, follow: bool = True) -> str:
     return ''
 
 
-def dump_spot_job_queue() -> str:
+def filter_unfinished_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Filters out the finished jobs.
+
+    If a multi-task job is partially finished, all its tasks are kept.
+    """
+    non_finished_job_ids = {
+        job['job_id'] for job in jobs if not job['status'].is_terminal()
+    }
+    return [job for job in jobs if job['job_id'] in non_finished_job_ids]
+
+
+def dump_spot_job_queue(skip_finished: bool = False) -> str:
     jobs = spot_state.get_spot_jobs()
+    if skip_finished:
+        # Filter on the controller, so that the (possibly many) finished jobs
+        # are neither looked up below nor sent back to the client.
+        jobs = filter_unfinished_jobs(jobs)
 
     for job in jobs:
         end_at = job['end_at']
@@ -679,9 +694,15 @@ class SpotCodeGen:
     ]
 
     @classmethod
-    def get_job_table(cls) -> str:
+    def get_job_table(cls, skip_finished: bool = False) -> str:
         code = [
-            'job_table = spot_utils.dump_spot_job_queue()',
+            # Controllers launched by an older SkyPilot do not support
+            # skip_finished; the caller filters the jobs in that case.
+            'import inspect',
+            f'kwargs = {{\'skip_finished\': {skip_finished}}} '
+            'if \'skip_finished\' in inspect.signature('
+            'spot_utils.dump_spot_job_queue).parameters else {}',
+            'job_table = spot_utils.dump_spot_job_queue(**kwargs)',
             'print(job_table, flush=True)',
         ]
         return cls._build(code)
@@ -750,8 +771,21 @@ class SpotCodeGen:
 def dump_job_table_cache(job_table: str):
     """Dump job table cache to file."""
     cache_file = pathlib.Path(_SPOT_STATUS_CACHE).expanduser()
-    with cache_file.open('w') as f:
+    # Write to a temporary file and rename it, so that concurrent readers
+    # never see a partially written cache.
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    with tmp_file.open('w') as f:
         json.dump((time.time(), job_table), f)
+    os.replace(tmp_file, cache_file)
+
+
+def clear_job_table_cache():
+    """Remove the job table cache, e.g. after the jobs have changed."""
+    cache_file = pathlib.Path(_SPOT_STATUS_CACHE).expanduser()
+    try:
+        cache_file.unlink()
+    except FileNotFoundError:
+        pass
 
 
 def load_job_table_cache() -> Optional[Tuple[float, str]]:
@@ -1,5 +1,6 @@
 """Utils shared between all of sky"""
 
+import copy
 import difflib
 import functools
 import getpass
@@ -249,20 +250,37 @@ def user_and_hostname_hash() -> str:
     return f'{getpass.getuser()}-{hostname_hash}'
 
 
+# The libyaml-backed loader is much faster than the pure-Python one; it is not
+# available if PyYAML was built without libyaml.
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 def read_yaml(path) -> Dict[str, Any]:
     with open(path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
     return config
 
 
+@functools.lru_cache(maxsize=16)
+def _load_yaml_all_cached(contents: str) -> List[Dict[str, Any]]:
+    configs = list(yaml.load_all(contents, Loader=_YAML_SAFE_LOADER))
+    if not configs:
+        # Empty YAML file.
+        return [{}]
+    return configs
+
+
 def read_yaml_all(path: str) -> List[Dict[str, Any]]:
+    """Reads all the documents of a YAML file.
+
+    The parsed documents are cached by the file's contents, as the CLI reads
+    the same task YAML more than once (e.g., `sky launch` checks the
+    entrypoint before loading it as a DAG). Reading the file is cheap compared
+    to parsing it. A copy is returned since callers mutate the configs.
+    """
     with open(path, 'r') as f:
-        config = yaml.safe_load_all(f)
-        configs = list(config)
-        if not configs:
-            # Empty YAML file.
-            return [{}]
-        return configs
+        contents = f.read()
+    return copy.deepcopy(_load_yaml_all_cached(contents))
 
 
 def dump_yaml(path, config) -> None:
@@ -549,6 +567,7 @@ def validate_schema(obj, schema, err_msg_prefix='', skip_none=True):
             raise ValueError(err_msg)
 
 
+@functools.lru_cache()
 def get_cleaned_username(username: str = '') -> str:
     """Cleans the username as some cloud provider have limitation on
     characters usage such as dot (.) is not allowed in GCP.
@@ -122,10 +122,14 @@ class Controllers(enum.Enum):
             The controller if the cluster name is a controller name.
             Otherwise, returns None.
         """
-        for controller in cls:
-            if controller.value.cluster_name == name:
-                return controller
-        return None
+        return _CONTROLLERS_BY_CLUSTER_NAME.get(name)
+
+
+# Cluster name -> controller, so that from_name() is a single dict lookup when
+# partitioning (possibly hundreds of) cluster records.
+_CONTROLLERS_BY_CLUSTER_NAME: Dict[str, Controllers] = {
+    controller.value.cluster_name: controller for controller in Controllers
+}
 
 
 # Install cli dependencies. Not using SkyPilot wheels because the wheel
@@ -9,6 +9,9 @@ class Options(enum.Enum):
     SHOW_DEBUG_INFO = 'SKYPILOT_DEBUG'
     DISABLE_LOGGING = 'SKYPILOT_DISABLE_USAGE_COLLECTION'
     MINIMIZE_LOGGING = 'SKYPILOT_MINIMIZE_LOGGING'
+    # Silences the warnings printed by deprecated CLI commands/aliases, e.g.,
+    # for scripts that still use them.
+    SUPPRESS_DEPRECATION = 'SKYPILOT_SUPPRESS_DEPRECATION'
     # Internal: this is used to skip the cloud user identity check,
     # which is used to protect cluster operations in a multi-identity
     # scenario. Currently, this is only used in the spot controller,
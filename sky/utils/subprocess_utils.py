@@ -41,15 +41,23 @@ def run_no_outputs(cmd, **kwargs):
                **kwargs)
 
 
-def run_in_parallel(func: Callable, args: List[Any]) -> List[Any]:
+def run_in_parallel(func: Callable,
+                    args: List[Any],
+                    num_threads: Optional[int] = None) -> List[Any]:
     """Run a function in parallel on a list of arguments.
 
     The function should raise a CommandError if the command fails.
     Returns a list of the return values of the function func, in the same order
     as the arguments.
+
+    Args:
+        func: The function to run.
+        args: The list of arguments to run the function on.
+        num_threads: The maximum number of threads to use. Defaults to the
+            number of CPUs.
     """
     # Reference: https://stackoverflow.com/questions/25790279/python-multiprocessing-early-termination # pylint: disable=line-too-long
-    with pool.ThreadPool() as p:
+    with pool.ThreadPool(processes=num_threads) as p:
         # Run the function in parallel on the arguments, keeping the order.
         return list(p.imap(func, args))
 
@@ -43,6 +43,59 @@ def test_infer_tpunode_type():
         assert cli._infer_interactive_node_type(spec) == 'tpunode', spec
 
 
+def test_parse_override_params():
+    assert cli._parse_override_params() == {}
+    assert cli._parse_override_params(cloud='none',
+                                      region='None',
+                                      gpus='NONE',
+                                      image_id='none') == {
+                                          'cloud': None,
+                                          'region': None,
+                                          'accelerators': None,
+                                          'image_id': None,
+                                      }
+    override_params = cli._parse_override_params(cloud='gcp',
+                                                 gpus='V100:2',
+                                                 use_spot=False,
+                                                 disk_size=100,
+                                                 ports=('8080',))
+    assert override_params.pop('cloud').is_same_cloud(sky.GCP())
+    assert override_params == {
+        'accelerators': 'V100:2',
+        'use_spot': False,
+        'disk_size': 100,
+        'ports': ('8080',),
+    }
+
+
+def test_is_yaml_path():
+    for entrypoint in ('task.yaml', ' task.yml ', '"my task.yaml"',
+                       "'task.yaml'", 'my\\ task.yaml'):
+        assert cli._is_yaml_path(entrypoint), entrypoint
+    for entrypoint in ('python train.py', 'cat task.yaml', 'task.yaml --x',
+                       '"task.yaml" b', 'echo "hi"'):
+        assert not cli._is_yaml_path(entrypoint), entrypoint
+
+
+def test_status_ip_reads_single_record(monkeypatch):
+    handle = object.__new__(sky.backends.CloudVmRayResourceHandle)
+    handle.launched_resources = sky.Resources()
+    handle.stable_internal_external_ips = [('10.0.0.1', '1.2.3.4')]
+    record = {'name': 'c1', 'status': sky.ClusterStatus.UP, 'handle': handle}
+    monkeypatch.setattr(cli.global_user_state, 'get_glob_cluster_names_many',
+                        lambda names: {name: ['c1'] for name in names})
+    monkeypatch.setattr(cli.global_user_state, 'get_cluster_from_name',
+                        lambda name: record if name == 'c1' else None)
+
+    def _status(*args, **kwargs):
+        raise AssertionError('core.status() should not be called for --ip.')
+
+    monkeypatch.setattr(cli.core, 'status', _status)
+    result = cli_testing.CliRunner().invoke(cli.status, ['--ip', 'c*'])
+    assert not result.exit_code, result.output
+    assert result.output.strip() == '1.2.3.4'
+
+
 def test_accelerator_mismatch(enable_all_clouds):
     """Test the specified accelerator does not match the instance_type."""
 
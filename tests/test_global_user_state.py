@@ -3,9 +3,75 @@ import sys
 import pytest
 
 import sky
+from sky import global_user_state
+from sky.utils import db_utils
+
+
+@pytest.fixture
+def _mock_db(tmp_path, monkeypatch):
+    """Points global_user_state at an empty database under tmp_path."""
+    db = db_utils.SQLiteConn(str(tmp_path / 'state.db'),
+                             global_user_state.create_table)
+    monkeypatch.setattr(global_user_state, '_DB', db)
+    return db
 
 
 @pytest.mark.skipif(sys.platform != 'linux', reason='Only test in CI.')
 def test_enabled_clouds_empty():
     # In test environment, no cloud should be enabled.
     assert sky.global_user_state.get_enabled_clouds() == []
+
+
+def test_get_glob_names_many(_mock_db):
+    db = _mock_db
+    for name in ['train-1', 'train-2', 'dev']:
+        db.cursor.execute('INSERT INTO clusters (name) VALUES (?)', (name,))
+        db.cursor.execute('INSERT INTO storage (name) VALUES (?)', (name,))
+    db.conn.commit()
+
+    patterns = ['train-*', 'dev', 'missing', 'd?v']
+    expected = {
+        'train-*': ['train-1', 'train-2'],
+        'dev': ['dev'],
+        'missing': [],
+        'd?v': ['dev'],
+    }
+    for get_many, get_one in [
+        (global_user_state.get_glob_cluster_names_many,
+         global_user_state.get_glob_cluster_names),
+        (global_user_state.get_glob_storage_names_many,
+         global_user_state.get_glob_storage_name),
+    ]:
+        matches = get_many(patterns)
+        assert list(matches) == patterns
+        for pattern in patterns:
+            assert sorted(matches[pattern]) == expected[pattern]
+            assert sorted(get_one(pattern)) == expected[pattern]
+    assert global_user_state.get_glob_cluster_names_many([]) == {}
+
+
+def test_set_cluster_status_updates_timestamp(_mock_db, monkeypatch):
+    db = _mock_db
+    db.cursor.execute('INSERT INTO clusters (name, status) VALUES (?, ?)',
+                      ('c', sky.ClusterStatus.UP.value))
+    db.conn.commit()
+
+    def _get_status_updated_at():
+        rows = db.cursor.execute(
+            'SELECT status_updated_at FROM clusters WHERE name=(?)', ('c',))
+        return rows.fetchone()[0]
+
+    assert _get_status_updated_at() is None
+    monkeypatch.setattr(global_user_state.time, 'time', lambda: 1000)
+    global_user_state.set_cluster_status('c', sky.ClusterStatus.STOPPED)
+    assert _get_status_updated_at() == 1000
+
+
+def test_get_cluster_names(_mock_db):
+    db = _mock_db
+    for name, launched_at in [('old', 1), ('new', 3), ('mid', 2)]:
+        db.cursor.execute(
+            'INSERT INTO clusters (name, launched_at) VALUES (?, ?)',
+            (name, launched_at))
+    db.conn.commit()
+    assert global_user_state.get_cluster_names() == ['new', 'mid', 'old']
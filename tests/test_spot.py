@@ -1,5 +1,6 @@
 import tempfile
 import textwrap
+import types
 
 import click
 from click import testing as cli_testing
@@ -182,3 +183,24 @@ class TestControllerOperations:
         assert result.exit_code == 1
         assert 'Cancelling the spot controller\'s jobs is not allowed.' in str(
             result.output)
+
+
+def test_spot_cancel_clears_job_table_cache(monkeypatch, tmp_path):
+    """Test that cancelling spot jobs drops the jobs cached by `sky status`."""
+    cache_path = tmp_path / 'spot_status_cache.txt'
+    monkeypatch.setattr('sky.spot.spot_utils._SPOT_STATUS_CACHE',
+                        str(cache_path))
+    handle = types.SimpleNamespace(head_ip='1.2.3.4')
+    monkeypatch.setattr('sky.backends.backend_utils.is_controller_up',
+                        lambda *args, **kwargs: (sky.ClusterStatus.UP, handle))
+    monkeypatch.setattr('sky.backends.backend_utils.get_backend_from_handle',
+                        lambda handle: backends.CloudVmRayBackend())
+    monkeypatch.setattr(backends.CloudVmRayBackend, 'run_on_head',
+                        lambda *args, **kwargs: (0, '', ''))
+
+    spot.dump_job_table_cache('[]')
+    assert spot.load_job_table_cache() is not None
+    sky.spot_cancel(all=True)
+    assert spot.load_job_table_cache() is None
+    # Clearing a missing cache is a no-op.
+    spot.clear_job_table_cache()
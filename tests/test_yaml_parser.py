@@ -4,6 +4,7 @@ import textwrap
 import pytest
 
 from sky.task import Task
+from sky.utils import common_utils
 
 
 def _create_config_file(config: str, tmp_path: pathlib.Path) -> str:
@@ -111,3 +112,27 @@ def test_invalid_fields_storage(tmp_path):
     with pytest.raises(AssertionError) as e:
         Task.from_yaml(config_path)
     assert 'Invalid storage args' in e.value.args[0]
+
+
+def test_read_yaml_all_cache(tmp_path):
+    config_path = _create_config_file(
+        textwrap.dedent("""\
+            name: dag
+            ---
+            run: echo 1
+            """), tmp_path)
+    configs = common_utils.read_yaml_all(config_path)
+    assert configs == [{'name': 'dag'}, {'run': 'echo 1'}]
+
+    # Callers mutate the returned configs; the cached copy must be unaffected.
+    configs[1].pop('run')
+    assert common_utils.read_yaml_all(config_path)[1] == {'run': 'echo 1'}
+
+    # A modified file is re-read, even if its size is unchanged.
+    config_path.write_text('run: echo 2\n')
+    assert common_utils.read_yaml_all(config_path) == [{'run': 'echo 2'}]
+    config_path.write_text('run: echo 3\n')
+    assert common_utils.read_yaml_all(config_path) == [{'run': 'echo 3'}]
+
+    config_path.write_text('')
+    assert common_utils.read_yaml_all(config_path) == [{}]